@@ -0,0 +1,61 @@
+"""add composite and partial indexes
+
+Revision ID: 2c96f5cc366c
+Revises: cbc1308ba394
+Create Date: 2026-10-16 10:12:41.118204
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2c96f5cc366c"
+down_revision: str | Sequence[str] | None = "cbc1308ba394"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+
+    indexes = {i["name"] for i in sa.inspect(conn).get_indexes("games")}
+    if "ix_games_notification_sent" in indexes:
+        op.drop_index("ix_games_notification_sent", table_name="games")
+    if "ix_games_unnotified_date" not in indexes:
+        op.create_index(
+            "ix_games_unnotified_date", "games", ["date"], unique=False,
+            sqlite_where=sa.text("notification_sent = 0"),
+        )
+
+    indexes = {i["name"] for i in sa.inspect(conn).get_indexes("notification_jobs")}
+    if "ix_notification_jobs_status" in indexes:
+        op.drop_index("ix_notification_jobs_status", table_name="notification_jobs")
+    if "ix_notification_jobs_status_scheduled_time" not in indexes:
+        op.create_index(
+            "ix_notification_jobs_status_scheduled_time", "notification_jobs",
+            ["status", "scheduled_time"], unique=False,
+        )
+
+    indexes = {i["name"] for i in sa.inspect(conn).get_indexes("transactions")}
+    if "ix_transactions_notification_sent" in indexes:
+        op.drop_index("ix_transactions_notification_sent", table_name="transactions")
+    if "ix_transactions_unsent_date" not in indexes:
+        op.create_index(
+            "ix_transactions_unsent_date", "transactions", ["transaction_date"], unique=False,
+            sqlite_where=sa.text("notification_sent = 0"),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_transactions_unsent_date", table_name="transactions")
+    op.create_index("ix_transactions_notification_sent", "transactions", ["notification_sent"], unique=False)
+    op.drop_index("ix_notification_jobs_status_scheduled_time", table_name="notification_jobs")
+    op.create_index("ix_notification_jobs_status", "notification_jobs", ["status"], unique=False)
+    op.drop_index("ix_games_unnotified_date", table_name="games")
+    op.create_index("ix_games_notification_sent", "games", ["notification_sent"], unique=False)
@@ -0,0 +1,71 @@
+"""server-side created_at defaults
+
+Revision ID: 5befc94fa028
+Revises: f82fc89bef48
+Create Date: 2026-10-16 11:41:52.204719
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5befc94fa028"
+down_revision: str | Sequence[str] | None = "f82fc89bef48"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, timestamp column) pairs that default to the insert time
+TIMESTAMP_COLUMNS = (
+    ("games", "created_at"),
+    ("notification_jobs", "created_at"),
+    ("users", "created_at"),
+    ("transactions", "created_at"),
+    ("user_transaction_preferences", "created_at"),
+    ("playbyplay_sessions", "started_at"),
+    ("inning_posts", "created_at"),
+    ("play_messages", "created_at"),
+)
+
+# Partial indexes are dropped around the SQLite table rebuild and recreated
+# after it, so their WHERE clauses survive regardless of reflection support
+PARTIAL_INDEXES = {
+    "games": ("ix_games_unnotified_date", ["date"]),
+    "transactions": ("ix_transactions_unsent_date", ["transaction_date"]),
+}
+
+
+def _set_server_default(server_default: sa.sql.ClauseElement | None) -> None:
+    conn = op.get_bind()
+
+    for table, column in TIMESTAMP_COLUMNS:
+        partial = PARTIAL_INDEXES.get(table)
+        if partial and partial[0] in {i["name"] for i in sa.inspect(conn).get_indexes(table)}:
+            op.drop_index(partial[0], table_name=table)
+
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.DateTime(timezone=True),
+                existing_nullable=True,
+                server_default=server_default,
+            )
+
+        if partial:
+            op.create_index(
+                partial[0], table, partial[1], unique=False,
+                sqlite_where=sa.text("notification_sent = 0"),
+            )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _set_server_default(sa.func.now())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _set_server_default(None)
@@ -0,0 +1,48 @@
+"""unique transaction preferences chat_id
+
+Revision ID: 6a13d569d978
+Revises: 5befc94fa028
+Create Date: 2026-10-16 12:08:36.771402
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6a13d569d978"
+down_revision: str | Sequence[str] | None = "5befc94fa028"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    indexes = {i["name"]: i for i in sa.inspect(conn).get_indexes("user_transaction_preferences")}
+    existing = indexes.get("ix_user_transaction_preferences_chat_id")
+    if existing and existing["unique"]:
+        return
+
+    # Keep the most recent row for any chat saved twice by the old
+    # select-then-insert path
+    op.execute(
+        "DELETE FROM user_transaction_preferences WHERE id NOT IN "
+        "(SELECT MAX(id) FROM user_transaction_preferences GROUP BY chat_id)"
+    )
+    if existing:
+        op.drop_index("ix_user_transaction_preferences_chat_id", table_name="user_transaction_preferences")
+    op.create_index(
+        "ix_user_transaction_preferences_chat_id", "user_transaction_preferences", ["chat_id"], unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_user_transaction_preferences_chat_id", table_name="user_transaction_preferences")
+    op.create_index(
+        "ix_user_transaction_preferences_chat_id", "user_transaction_preferences", ["chat_id"], unique=False
+    )
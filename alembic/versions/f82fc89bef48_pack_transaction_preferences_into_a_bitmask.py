@@ -0,0 +1,72 @@
+"""pack transaction preferences into a bitmask
+
+Revision ID: f82fc89bef48
+Revises: 2c96f5cc366c
+Create Date: 2026-10-16 11:02:17.530961
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f82fc89bef48"
+down_revision: str | Sequence[str] | None = "2c96f5cc366c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (column, bit, default) for each flag in TransactionPreferenceFlag
+PREFERENCE_BITS = (
+    ("trades", 1, True),
+    ("signings", 2, True),
+    ("recalls", 4, True),
+    ("options", 8, True),
+    ("injuries", 16, True),
+    ("activations", 32, True),
+    ("releases", 64, False),
+    ("status_changes", 128, False),
+    ("other", 256, False),
+)
+DEFAULT_MASK = sum(bit for _, bit, default in PREFERENCE_BITS if default)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    cols = {c["name"] for c in sa.inspect(conn).get_columns("user_transaction_preferences")}
+
+    if "preferences_mask" not in cols:
+        op.add_column(
+            "user_transaction_preferences",
+            sa.Column("preferences_mask", sa.Integer(), nullable=False, server_default=str(DEFAULT_MASK)),
+        )
+
+    old_cols = [(name, bit, default) for name, bit, default in PREFERENCE_BITS if name in cols]
+    if old_cols:
+        mask = " + ".join(
+            f"(CASE WHEN COALESCE({name}, {int(default)}) THEN {bit} ELSE 0 END)"
+            for name, bit, default in old_cols
+        )
+        op.execute(f"UPDATE user_transaction_preferences SET preferences_mask = {mask}")
+
+        with op.batch_alter_table("user_transaction_preferences") as batch_op:
+            for name, _, _ in old_cols:
+                batch_op.drop_column(name)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("user_transaction_preferences") as batch_op:
+        for name, _, _ in PREFERENCE_BITS:
+            batch_op.add_column(sa.Column(name, sa.Boolean(), nullable=True))
+
+    assignments = ", ".join(
+        f"{name} = (preferences_mask & {bit}) != 0" for name, bit, _ in PREFERENCE_BITS
+    )
+    op.execute(f"UPDATE user_transaction_preferences SET {assignments}")
+
+    with op.batch_alter_table("user_transaction_preferences") as batch_op:
+        batch_op.drop_column("preferences_mask")
@@ -1,14 +1,22 @@
 """Health check API endpoints."""
 
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
+from time import monotonic
 from typing import Any
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 import structlog
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Response
 from pydantic import BaseModel, field_serializer
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from ..config import get_settings
-from ..database import get_database_session
+from ..database import activity, get_async_database_url, get_pool_options
+from .system_sampler import SystemSampler
 
 logger = structlog.get_logger(__name__)
 
@@ -39,14 +47,102 @@ class HealthCheckApp:
             version="0.1.0",
             docs_url="/docs" if self.settings.debug else None,
             redoc_url="/redoc" if self.settings.debug else None,
+            lifespan=self.lifespan,
         )
+        self.app.state.hc = self
+
+        # Payload fields that never change at runtime
+        self._db_scheme = self.settings.database_url.split("://")[0] + "://***"  # Hide credentials
+        self._config_settings_dict = {
+            "log_level": self.settings.log_level,
+            "environment": self.settings.environment,
+            "debug": self.settings.debug,
+            "scheduler_timezone": self.settings.scheduler_timezone,
+            "health_check_port": self.settings.health_check_port,
+        }
+        self._static_response_fields = {
+            "version": "0.1.0",
+            "environment": self.settings.environment,
+        }
+
+        # Timezone data never changes at runtime, so validate it once
+        try:
+            ZoneInfo(self.settings.scheduler_timezone)
+            self._tz_valid = True
+        except (ZoneInfoNotFoundError, ValueError):
+            self._tz_valid = False
+
+        # Dedicated engine for health probes so they neither compete with nor
+        # tear down the application's main connection pool.
+        self._hc_engine = create_async_engine(
+            get_async_database_url(self.settings.database_url),
+            **get_pool_options(self.settings.database_url, pool_size=2, max_overflow=0),
+            pool_pre_ping=False,
+        )
+        self._hc_sessionmaker = async_sessionmaker(self._hc_engine, class_=AsyncSession)
+
+        # psutil work happens on a background interval, not per request; the
+        # sampler task runs for the lifetime of the app (see lifespan)
+        self.sampler = SystemSampler(interval=self.settings.health_sampler_interval)
+
+        # Most recent (monotonic timestamp, response, serialized body); concurrent
+        # probes within the TTL share one refresh behind the lock.
+        self._cache: tuple[float, HealthResponse, bytes] | None = None
+        self._lock = asyncio.Lock()
+
+        # Add routes: cheap liveness probes plus the full readiness check
+        self.app.get("/")(self.liveness)
+        self.app.get("/live")(self.liveness)
+        self.app.get("/health")(self.health_check)
+        self.app.get("/ready")(self.health_check)
+
+    @asynccontextmanager
+    async def lifespan(self, _app: FastAPI) -> AsyncIterator[None]:
+        """Start background resources before serving and release them on shutdown."""
+        logger.info("Health check API starting up")
+        self.sampler.start()
+
+        try:
+            yield
+        finally:
+            logger.info("Health check API shutting down")
+            await self.sampler.stop()
+            await self._hc_engine.dispose()
 
-        # Add routes
-        self.app.get("/health", response_model=HealthResponse)(self.health_check)
-        self.app.get("/", response_model=HealthResponse)(self.health_check)
+    async def liveness(self) -> dict[str, str]:
+        """Liveness endpoint: the process is up and serving, no I/O performed."""
+        return {"status": "alive"}
 
-    async def health_check(self) -> HealthResponse:
+    async def health_check(self) -> Response:
         """Comprehensive health check endpoint."""
+        response, body = await self._get_health_response()
+
+        # Return appropriate HTTP status
+        return Response(
+            content=body,
+            media_type="application/json",
+            status_code=503 if response.status == "unhealthy" else 200,
+        )
+
+    async def _get_health_response(self) -> tuple[HealthResponse, bytes]:
+        """Return the cached health response and its JSON body, refreshing once the TTL expires."""
+        cache = self._cache
+        if cache and monotonic() - cache[0] < self.settings.health_cache_ttl:
+            return cache[1], cache[2]
+
+        async with self._lock:
+            # Another probe may have refreshed the cache while we waited
+            cache = self._cache
+            if cache and monotonic() - cache[0] < self.settings.health_cache_ttl:
+                return cache[1], cache[2]
+
+            response = await self._run_checks()
+            body = response.model_dump_json().encode()
+            self._cache = (monotonic(), response, body)
+            return response, body
+
+    async def _run_checks(self) -> HealthResponse:
+        """Run all health checks and assemble the response."""
         checks = {}
         overall_status = "healthy"
 
@@ -70,43 +166,55 @@ class HealthCheckApp:
             overall_status = "unhealthy"
             checks = {"error": {"message": str(e)}}
 
-        response = HealthResponse(
+        return HealthResponse(
             status=overall_status,
             timestamp=datetime.now(UTC),
-            version="0.1.0",
-            environment=self.settings.environment,
+            version=self._static_response_fields["version"],
+            environment=self._static_response_fields["environment"],
             checks=checks
         )
 
-        # Return appropriate HTTP status
-        if overall_status == "unhealthy":
-            raise HTTPException(status_code=503, detail=response.model_dump())
-
-        return response
-
     async def _check_database(self) -> dict[str, Any]:
         """Check database connectivity and basic operations."""
-        try:
-            db_session = get_database_session(self.settings)
+        # Recent application traffic already proves the database is reachable
+        last_activity = activity.last()
+        if last_activity is not None:
+            idle_seconds = monotonic() - last_activity
+            if idle_seconds < self.settings.health_db_activity_window:
+                return {
+                    "healthy": True,
+                    "last_activity_seconds": round(idle_seconds, 2),
+                    "database_url": self._db_scheme,
+                    "status": "connected"
+                }
 
+        try:
             # Test basic connectivity with a simple query
             start_time = datetime.now(UTC)
 
-            # Use raw SQL for a simple connectivity test
-            async with db_session.get_session() as session:
-                from sqlalchemy import text
-                result = await session.execute(text("SELECT 1"))
-                result.fetchone()  # fetchone() is not awaitable
+            # Use raw SQL for a simple connectivity test, bounded so a hung
+            # database can't hang the probe with it
+            timeout = self.settings.health_check_db_timeout
+            try:
+                async with self._hc_sessionmaker() as session:
+                    result = await asyncio.wait_for(session.execute(text("SELECT 1")), timeout=timeout)
+                    result.fetchone()  # fetchone() is not awaitable
+            except TimeoutError:
+                logger.error("Database health check timed out", timeout=timeout)
+                return {
+                    "healthy": False,
+                    "error": "db ping timeout",
+                    "latency_ms": round(timeout * 1000, 2),
+                    "status": "disconnected"
+                }
 
             end_time = datetime.now(UTC)
             latency_ms = (end_time - start_time).total_seconds() * 1000
 
-            await db_session.close()
-
             return {
                 "healthy": True,
                 "latency_ms": round(latency_ms, 2),
-                "database_url": self.settings.database_url.split("://")[0] + "://***",  # Hide credentials
+                "database_url": self._db_scheme,
                 "status": "connected"
             }
 
@@ -119,45 +227,8 @@ class HealthCheckApp:
             }
 
     def _check_system(self) -> dict[str, Any]:
-        """Check basic system health."""
-        try:
-            import os
-
-            import psutil
-
-            # Get memory usage
-            memory = psutil.virtual_memory()
-
-            # Get current process info
-            process = psutil.Process(os.getpid())
-
-            return {
-                "healthy": True,
-                "memory": {
-                    "total_mb": round(memory.total / 1024 / 1024, 2),
-                    "available_mb": round(memory.available / 1024 / 1024, 2),
-                    "percent_used": memory.percent,
-                },
-                "process": {
-                    "memory_mb": round(process.memory_info().rss / 1024 / 1024, 2),
-                    "cpu_percent": process.cpu_percent(),
-                    "pid": process.pid,
-                },
-                "uptime_seconds": round((datetime.now(UTC) - datetime.fromtimestamp(process.create_time(), UTC)).total_seconds(), 2)
-            }
-
-        except ImportError:
-            # psutil not available, return basic info
-            return {
-                "healthy": True,
-                "message": "Limited system info (psutil not available)",
-                "basic_check": "passed"
-            }
-        except Exception as e:
-            return {
-                "healthy": False,
-                "error": str(e)
-            }
+        """Check basic system health from the sampler's latest snapshot."""
+        return self.sampler.latest()
 
     def _check_configuration(self) -> dict[str, Any]:
         """Check configuration validity."""
@@ -170,23 +241,14 @@ class HealthCheckApp:
         if not self.settings.telegram_chat_id:
             issues.append("telegram_chat_id not configured")
 
-        # Check if timezone is valid
-        try:
-            import pytz
-            pytz.timezone(self.settings.scheduler_timezone)
-        except Exception:
+        # Timezone was validated at startup
+        if not self._tz_valid:
             issues.append(f"Invalid timezone: {self.settings.scheduler_timezone}")
 
         return {
             "healthy": len(issues) == 0,
             "issues": issues,
-            "settings": {
-                "log_level": self.settings.log_level,
-                "environment": self.settings.environment,
-                "debug": self.settings.debug,
-                "scheduler_timezone": self.settings.scheduler_timezone,
-                "health_check_port": self.settings.health_check_port,
-            }
+            "settings": self._config_settings_dict,
         }
 
 
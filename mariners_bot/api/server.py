@@ -3,7 +3,7 @@
 import asyncio
 import signal
 import sys
-from contextlib import asynccontextmanager, suppress
+from contextlib import suppress
 from typing import Any
 
 import structlog
@@ -33,9 +33,10 @@ class HealthServer:
             self.app,
             host="0.0.0.0",
             port=self.settings.health_check_port,
-            log_level=self.settings.log_level.lower(),
-            access_log=self.settings.debug,
-            loop="asyncio"
+            # Probes hit this port constantly; keep uvicorn quiet unless asked
+            log_level="warning",
+            access_log=self.settings.health_access_log,
+            http="httptools",
         )
 
         self.server = uvicorn.Server(config)
@@ -67,22 +68,13 @@ class HealthServer:
 
 
 # Standalone health server for development/testing
-@asynccontextmanager
-async def lifespan(_app: FastAPI) -> Any:
-    """FastAPI lifespan context manager."""
-    logger.info("Health check API starting up")
-    yield
-    logger.info("Health check API shutting down")
-
-
 def create_standalone_app() -> FastAPI:
-    """Create standalone health check app with lifespan management."""
-    health_app = create_health_app()
-
-    # Add lifespan management
-    health_app.router.lifespan_context = lifespan
+    """Create standalone health check app.
 
-    return health_app
+    Startup and shutdown of the app's background resources are handled by
+    the lifespan defined on ``HealthCheckApp``.
+    """
+    return create_health_app()
 
 
 async def run_health_server_standalone() -> None:
@@ -102,8 +94,10 @@ async def run_health_server_standalone() -> None:
         create_standalone_app(),
         host="0.0.0.0",
         port=settings.health_check_port,
-        log_level=settings.log_level.lower(),
-        access_log=settings.debug,
+        log_level="warning",
+        access_log=settings.health_access_log,
+        http="httptools",
+        lifespan="on",
     )
 
     server = uvicorn.Server(config)
@@ -0,0 +1,94 @@
+"""Background sampler for process and system metrics reported by health checks."""
+
+import asyncio
+import os
+from contextlib import suppress
+from datetime import UTC, datetime
+from typing import Any
+
+try:
+    import psutil
+except ImportError:  # pragma: no cover - psutil is optional
+    psutil = None
+
+
+class SystemSampler:
+    """Periodically samples memory/CPU usage so health probes can read a cached snapshot.
+
+    Keeping one long-lived ``psutil.Process`` also makes ``cpu_percent()``
+    meaningful: it reports usage since the previous sample rather than 0.0.
+    """
+
+    def __init__(self, interval: float = 2.0) -> None:
+        """Initialize the sampler."""
+        self.interval = interval
+        self._process = psutil.Process(os.getpid()) if psutil else None
+        self._snapshot: dict[str, Any] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start the sampling task if it isn't already running."""
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the sampling task."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+
+    def latest(self) -> dict[str, Any]:
+        """Return the most recent snapshot, sampling once if none exists yet."""
+        if self._snapshot is None:
+            self._snapshot = self.sample()
+        return self._snapshot
+
+    def sample(self) -> dict[str, Any]:
+        """Collect a fresh snapshot of system and process metrics."""
+        if psutil is None or self._process is None:
+            # psutil not available, return basic info
+            return {
+                "healthy": True,
+                "message": "Limited system info (psutil not available)",
+                "basic_check": "passed"
+            }
+
+        try:
+            process = self._process
+            memory = psutil.virtual_memory()
+
+            # oneshot() caches the /proc reads shared by the calls below
+            with process.oneshot():
+                rss = process.memory_info().rss
+                cpu_percent = process.cpu_percent()
+                create_time = process.create_time()
+
+            return {
+                "healthy": True,
+                "memory": {
+                    "total_mb": round(memory.total / 1024 / 1024, 2),
+                    "available_mb": round(memory.available / 1024 / 1024, 2),
+                    "percent_used": memory.percent,
+                },
+                "process": {
+                    "memory_mb": round(rss / 1024 / 1024, 2),
+                    "cpu_percent": cpu_percent,
+                    "pid": process.pid,
+                },
+                "uptime_seconds": round((datetime.now(UTC) - datetime.fromtimestamp(create_time, UTC)).total_seconds(), 2)
+            }
+
+        except Exception as e:
+            return {
+                "healthy": False,
+                "error": str(e)
+            }
+
+    async def _run(self) -> None:
+        """Refresh the snapshot every ``interval`` seconds until cancelled."""
+        while True:
+            self._snapshot = self.sample()
+            await asyncio.sleep(self.interval)
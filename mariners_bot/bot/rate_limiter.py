@@ -0,0 +1,89 @@
+"""Token bucket rate limiting for outgoing Telegram messages."""
+
+import asyncio
+from time import monotonic
+from types import TracebackType
+
+
+class TokenBucket:
+    """Async token bucket allowing ``rate`` acquisitions per ``period`` seconds.
+
+    Waiters are served in arrival order: the lock is held while sleeping for
+    the next token, so later callers queue behind earlier ones.
+    """
+
+    def __init__(self, rate: float, period: float = 1.0) -> None:
+        """Initialize a full bucket."""
+        self.capacity = rate
+        self._fill_rate = rate / period
+        self._tokens = rate
+        self._updated = monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add tokens earned since the last update."""
+        now = monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._fill_rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._fill_rate)
+                self._refill()
+            self._tokens -= 1
+
+    async def __aenter__(self) -> None:
+        """Acquire a token on entering the context."""
+        await self.acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Tokens are not returned; nothing to do on exit."""
+
+
+class AdaptiveTokenBucket(TokenBucket):
+    """Token bucket whose fill rate backs off on congestion and recovers on success.
+
+    Additive-increase/multiplicative-decrease: each rate-limit response cuts the
+    fill rate by ``decrease_factor`` (never below ``min_rate``) and drains the
+    bucket, and each successful send adds ``increase_step`` back, up to ``rate``.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        period: float = 1.0,
+        min_rate: float = 1.0,
+        decrease_factor: float = 0.5,
+        increase_step: float = 0.5,
+    ) -> None:
+        """Initialize a full bucket at its maximum rate."""
+        super().__init__(rate, period)
+        self._max_fill_rate = self._fill_rate
+        self._min_fill_rate = min_rate / period
+        self._decrease_factor = decrease_factor
+        self._increase_step = increase_step / period
+
+    @property
+    def fill_rate(self) -> float:
+        """Current refill rate in tokens per second."""
+        return self._fill_rate
+
+    def on_success(self) -> None:
+        """Nudge the fill rate back up after a successful send."""
+        if self._fill_rate < self._max_fill_rate:
+            self._refill()
+            self._fill_rate = min(self._max_fill_rate, self._fill_rate + self._increase_step)
+
+    def on_congestion(self) -> None:
+        """Back off after a rate-limit response."""
+        self._refill()
+        self._fill_rate = max(self._min_fill_rate, self._fill_rate * self._decrease_factor)
+        self._tokens = 0
@@ -1,8 +1,17 @@
 """Telegram bot implementation."""
 
 import asyncio
+import functools
+import logging
+import random
+from contextlib import suppress
+from datetime import UTC, date, datetime, timedelta
+from time import monotonic
+from typing import Any
+from zoneinfo import ZoneInfo
 
 import structlog
+from opentelemetry import trace
 from telegram import Message, MessageOriginChannel, Update
 from telegram.constants import ParseMode
 from telegram.error import RetryAfter, TelegramError
@@ -14,12 +23,271 @@ from telegram.ext import (
     filters,
 )
 
+from ..clients import MLBClient
 from ..config import Settings
 from ..database import Repository, get_database_session
-from ..models import NotificationJob, User
+from ..models import Game, NotificationJob, Transaction, UserTransactionPreferences
+from ..observability import get_tracer
+from .rate_limiter import AdaptiveTokenBucket, TokenBucket
+from .update_processor import PerChatUpdateProcessor
 
 logger = structlog.get_logger(__name__)
 
+# Proxy tracer; picks up the real provider once observability is configured
+_TRACER = get_tracer("mariners-bot.telegram")
+
+# Level check for per-recipient log calls in broadcast paths; mirrors the
+# stdlib filter_by_level processor so skipped events build no kwargs
+_log_enabled = logging.getLogger(__name__).isEnabledFor
+
+# Display timezone for game times
+_PT = ZoneInfo("America/Los_Angeles")
+
+# Telegram's documented send limits: ~30 msg/s bot-wide, 20 msg/min per group
+_GLOBAL_SEND_RATE = 30
+_GROUP_SEND_RATE_PER_MINUTE = 20
+
+# Max updates handled at once by the Telegram application
+_CONCURRENT_UPDATES = 32
+
+# Seconds to reuse the current/upcoming game lookup across /nextgame calls
+_NEXT_GAME_CACHE_TTL = 60
+
+# Probable pitchers are cached briefly and fetched with a deadline so a slow
+# MLB API can't stall /nextgame
+_PITCHER_CACHE_TTL = 600
+_PITCHER_FETCH_TIMEOUT = 2.0
+
+# Seconds to reuse the subscriber chat ID list between broadcasts
+_SUBSCRIBER_CACHE_TTL = 60
+
+# Seconds to reuse a chat's transaction preferences between settings commands
+_PREFERENCES_CACHE_TTL = 60
+
+# Retry backoff caps (seconds) so a broadcast doesn't stall on one chat
+_MAX_RETRY_AFTER_WAIT = 30
+_MAX_ERROR_BACKOFF = 8
+
+# Upper bound of the jittered sleep after each failed attempt, indexed by attempt
+_ERROR_BACKOFFS = tuple(min(2 ** attempt, _MAX_ERROR_BACKOFF) for attempt in range(5))
+
+# Thresholds for describing how long ago a live game started
+_ONE_MINUTE = timedelta(minutes=1)
+_ONE_HOUR = timedelta(hours=1)
+
+# Seconds between flushes of buffered last_seen updates
+_LAST_SEEN_FLUSH_INTERVAL = 30
+
+# Buffered notification job writes are flushed this often, or sooner once
+# this many are waiting
+_JOB_FLUSH_INTERVAL = 1.0
+_JOB_FLUSH_BATCH_SIZE = 100
+
+# Static command replies
+WELCOME_TEMPLATE = (
+    "⚾ Welcome to the Seattle Mariners Gameday Bot, {name}!\n\n"
+    "I'll notify you 5 minutes before each Mariners game starts with a direct link "
+    "to MLB Gameday.\n\n"
+    "Commands:\n"
+    "• /help - Show this help message\n"
+    "• /status - Check your subscription status\n"
+    "• /subscribe - Subscribe to notifications\n"
+    "• /unsubscribe - Unsubscribe from notifications\n"
+    "• /nextgame or /next_game - Get info about the next game\n\n"
+    "Go Mariners! 🌊"
+)
+
+HELP_MESSAGE = (
+    "⚾ <b>Seattle Mariners Gameday Bot</b>\n\n"
+    "I automatically notify you 5 minutes before each Mariners game starts and "
+    "keep you updated on all Mariners transactions!\n\n"
+    "<b>Game Commands:</b>\n"
+    "• /start - Start using the bot\n"
+    "• /help - Show this help message\n"
+    "• /status - Check your subscription status\n"
+    "• /subscribe - Subscribe to notifications\n"
+    "• /unsubscribe - Unsubscribe from notifications\n"
+    "• /nextgame or /next_game - Get info about the next upcoming game\n\n"
+    "<b>Transaction Commands:</b>\n"
+    "• /transactions - View recent Mariners transactions\n"
+    "• /transaction_settings - View/manage transaction notification preferences\n"
+    "• /toggle_trades - Toggle trade notifications\n"
+    "• /toggle_signings - Toggle free agent signing notifications\n"
+    "• /toggle_injuries - Toggle injury list notifications\n"
+    "• /toggle_recalls - Toggle player recall/option notifications\n"
+    "• /toggle_releases - Toggle player release notifications\n"
+    "• /toggle_status_changes - Toggle status change notifications\n"
+    "• /toggle_other - Toggle other transaction notifications\n"
+    "• /toggle_major_only - Toggle major league only filter\n\n"
+    "<b>Features:</b>\n"
+    "• 🔔 Automatic notifications 5 minutes before games\n"
+    "• 📰 Real-time Mariners transaction alerts\n"
+    "• 🔗 Direct links to MLB Gameday\n"
+    "• 🏟️ Game details (opponent, venue, time)\n"
+    "• ⚙️ Customizable transaction notifications\n"
+    "• 🌍 Timezone-aware (Pacific Time)\n\n"
+    "Go Mariners! 🌊"
+)
+
+SUBSCRIBE_MESSAGE = (
+    "✅ <b>Subscribed!</b>\n\n"
+    "You'll now receive notifications 5 minutes before each Mariners game starts. "
+    "I'll send you the game details and a direct link to MLB Gameday.\n\n"
+    "Use /unsubscribe if you want to stop receiving notifications."
+)
+
+UNSUBSCRIBE_MESSAGE = (
+    "❌ <b>Unsubscribed</b>\n\n"
+    "You won't receive game notifications anymore. "
+    "Use /subscribe if you want to re-enable them.\n\n"
+    "Thanks for using the Mariners bot! 🌊"
+)
+
+DEFAULT_REPLY = (
+    "⚾ Thanks for your message! I'm here to notify you about Mariners games.\n\n"
+    "Use /help to see what I can do, or /next_game to check the upcoming schedule!"
+)
+
+
+LIVE_GAME_TEMPLATE = (
+    "⚾ <b>Current Mariners Game</b>\n\n"
+    "🏟️ {matchup}\n"
+    "{location}\n"
+    "{status_line}\n"
+    "{pitcher_info}\n"
+    "📅 <b>Started:</b> {date_display}\n"
+    "🕐 <b>First Pitch:</b> {time_display}\n"
+    "📍 <b>Venue:</b> {venue}\n\n"
+    "<a href=\"{gameday_url}\">🔗 Watch LIVE on MLB Gameday</a>\n"
+    "<a href=\"{savant_url}\">📊 Advanced Analytics on Baseball Savant</a>\n\n"
+    "Go Mariners! 🌊⚾"
+)
+
+UPCOMING_GAME_TEMPLATE = (
+    "⚾ <b>Next Mariners Game</b>\n\n"
+    "🏟️ {matchup}\n"
+    "{location}\n"
+    "{status_line}\n"
+    "{pitcher_info}\n"
+    "📅 <b>Date:</b> {date_display}\n"
+    "🕐 <b>Time:</b> {time_display}\n"
+    "📍 <b>Venue:</b> {venue}\n\n"
+    "<a href=\"{gameday_url}\">🔗 Watch on MLB Gameday</a>\n"
+    "<a href=\"{savant_url}\">📊 Advanced Analytics on Baseball Savant</a>\n\n"
+    "I'll send a notification 5 minutes before first pitch! 🚨"
+)
+
+TRANSACTION_SETTINGS_TEMPLATE = (
+    "⚙️ <b>Transaction Notification Settings</b>\n\n"
+    "<b>Current Preferences:</b>\n"
+    "{preference_rows}\n\n"
+    "<b>Filters:</b>\n"
+    "{major_league_only} Major League Only\n\n"
+    "<b>Quick Toggle Commands:</b>\n"
+    "• /toggle_trades - Toggle trade notifications\n"
+    "• /toggle_signings - Toggle signing notifications\n"
+    "• /toggle_injuries - Toggle injury notifications\n"
+    "• /toggle_recalls - Toggle recall/option notifications\n"
+    "• /toggle_releases - Toggle release notifications\n"
+    "• /toggle_status_changes - Toggle status change notifications\n"
+    "• /toggle_other - Toggle other transaction notifications\n"
+    "• /toggle_major_only - Toggle major league filter\n\n"
+    "🌊 Go Mariners!"
+)
+
+# (preference attribute, label) rows listed by /transaction_settings
+_PREFERENCE_ROWS = (
+    ("trades", "Trades"),
+    ("signings", "Free Agent Signings"),
+    ("injuries", "Injury List Moves"),
+    ("activations", "Player Activations"),
+    ("recalls", "Recalls & Options"),
+    ("releases", "Player Releases"),
+    ("status_changes", "Status Changes"),
+    ("other", "Other Transactions"),
+)
+
+PREFERENCE_UPDATED_TEMPLATE = (
+    "⚙️ <b>Settings Updated</b>\n\n"
+    "{emoji} <b>{display_name}</b> notifications are now <b>{status}</b>.\n\n"
+    "Use /transaction_settings to see all your preferences.\n\n"
+    "🌊 Go Mariners!"
+)
+
+# /toggle_* command -> (preference attribute, display name)
+_TOGGLE_COMMANDS = {
+    "toggle_trades": ("trades", "Trade"),
+    "toggle_signings": ("signings", "Free Agent Signing"),
+    "toggle_injuries": ("injuries", "Injury List"),
+    "toggle_recalls": ("recalls", "Recall/Option"),
+    "toggle_releases": ("releases", "Player Release"),
+    "toggle_status_changes": ("status_changes", "Status Change"),
+    "toggle_other": ("other", "Other Transaction"),
+    "toggle_major_only": ("major_league_only", "Major League Only"),
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _pt_display(game_date: datetime) -> tuple[datetime, str, str]:
+    """Convert a game time to Pacific time with its display date and time strings.
+
+    Only a handful of games are ever shown, so the formatted strings are
+    memoized by game time.
+    """
+    game_time_pt = game_date.astimezone(_PT)
+    return game_time_pt, game_time_pt.strftime('%A, %B %d, %Y'), game_time_pt.strftime('%I:%M %p %Z')
+
+
+def _format_time_since(time_since_start: timedelta) -> str:
+    """Format how long ago an in-progress game started."""
+    if time_since_start < _ONE_MINUTE:
+        return "🚨 <b>STARTING NOW!</b>"
+
+    total_seconds = time_since_start.total_seconds()
+    if time_since_start < _ONE_HOUR:
+        return f"🔴 <b>LIVE</b> - Started {int(total_seconds / 60)} min ago"
+
+    hours = int(total_seconds / 3600)
+    minutes = int((total_seconds % 3600) / 60)
+    if minutes > 0:
+        return f"🔴 <b>LIVE</b> - Started {hours}h {minutes}m ago"
+    return f"🔴 <b>LIVE</b> - Started {hours}h ago"
+
+
+def _format_days_until(days_until: int) -> str:
+    """Format how far away an upcoming game is."""
+    if days_until == 0:
+        return "🔥 <b>TODAY!</b>"
+    elif days_until == 1:
+        return "📅 <b>Tomorrow</b>"
+    return f"📅 In {days_until} days"
+
+
+def _format_game_message(game: Game, live: bool, status_line: str, pitcher_info: str) -> str:
+    """Build the /nextgame reply for a game in progress or an upcoming game."""
+    _, date_display, time_display = _pt_display(game.date)
+
+    # Determine if Mariners are home or away
+    if game.is_mariners_home:
+        matchup = f"<b>{game.opponent} @ Seattle Mariners</b>"
+        location = "🏠 Home Game"
+    else:
+        matchup = f"<b>Seattle Mariners @ {game.opponent}</b>"
+        location = "✈️ Away Game"
+
+    template = LIVE_GAME_TEMPLATE if live else UPCOMING_GAME_TEMPLATE
+    return template.format(
+        matchup=matchup,
+        location=location,
+        status_line=status_line,
+        pitcher_info=pitcher_info,
+        date_display=date_display,
+        time_display=time_display,
+        venue=game.venue,
+        gameday_url=game.gameday_url,
+        savant_url=game.baseball_savant_url,
+    )
+
 
 class TelegramBot:
     """Telegram bot for sending game notifications."""
@@ -31,13 +299,66 @@ class TelegramBot:
         self.default_chat_id = settings.telegram_chat_id
 
         # Create bot application
-        self.application = Application.builder().token(self.bot_token).build()
+        # Chats are processed concurrently so a slow handler (e.g. /nextgame
+        # waiting on the MLB API) doesn't hold up everyone else's commands,
+        # while updates from the same chat still run one at a time in order
+        self.application = (
+            Application.builder()
+            .token(self.bot_token)
+            .concurrent_updates(PerChatUpdateProcessor(_CONCURRENT_UPDATES))
+            .build()
+        )
         self.bot = self.application.bot
 
         # Pending futures: channel_message_id -> Future[group_message_id]
         # Resolved by _handle_group_channel_forward when the auto-forward arrives.
         self._pending_channel_forwards: dict[int, asyncio.Future[int]] = {}
 
+        # Bounds in-flight broadcast sends across all concurrent broadcasts
+        self._send_semaphore = asyncio.Semaphore(settings.telegram_send_concurrency)
+
+        # Proactive throttling so sends wait for a token instead of tripping RetryAfter
+        # The global bucket slows down whenever Telegram still pushes back
+        self._global_limiter = AdaptiveTokenBucket(_GLOBAL_SEND_RATE)
+
+        # Shared "sends open" gate: one RetryAfter pauses every sender until
+        # Telegram's window passes, instead of each task sleeping on its own
+        self._sends_open = asyncio.Event()
+        self._sends_open.set()
+        self._sends_reopen_at = 0.0
+        self._sends_reopen_handle: asyncio.TimerHandle | None = None
+        self._group_limiters: dict[str, TokenBucket] = {}
+
+        # (monotonic timestamp, subscribed chat IDs); the generation is bumped
+        # whenever a subscription changes so in-flight refreshes aren't cached
+        self._subscriber_cache: tuple[float, list[int]] | None = None
+        self._subscriber_generation = 0
+
+        # (monotonic timestamp, (current games, upcoming games)) for /nextgame;
+        # the lock lets one caller refresh while concurrent callers wait
+        self._next_game_cache: tuple[float, tuple[list[Game], list[Game]]] | None = None
+        self._next_game_lock = asyncio.Lock()
+
+        # Shared MLB API client; its HTTP session is opened in start_polling so
+        # command handlers reuse warm connections instead of reconnecting per call
+        self.mlb_client = MLBClient(settings)
+
+        # game_id -> (monotonic timestamp, probable pitchers)
+        self._pitcher_cache: dict[str, tuple[float, dict[str, str]]] = {}
+
+        # chat_id -> (monotonic timestamp, transaction preferences); the bot is
+        # the only writer, so toggles refresh the entry after saving
+        self._preferences_cache: dict[int, tuple[float, UserTransactionPreferences]] = {}
+
+        # Buffered last_seen updates (chat_id -> timestamp), flushed periodically
+        self._pending_last_seen: dict[int, datetime] = {}
+        self._last_seen_task: asyncio.Task[None] | None = None
+
+        # Buffered notification job status writes (job_id -> latest job state)
+        self._job_buffer: dict[str, NotificationJob] = {}
+        self._job_flush_event = asyncio.Event()
+        self._job_flush_task: asyncio.Task[None] | None = None
+
         # Setup command handlers
         self._setup_handlers()
 
@@ -51,6 +372,10 @@ class TelegramBot:
         try:
             await self.application.initialize()
             await self.application.start()
+            await self.mlb_client.__aenter__()
+
+            self._last_seen_task = asyncio.create_task(self._run_last_seen_flusher())
+            self._job_flush_task = asyncio.create_task(self._run_job_flusher())
 
             logger.info("Telegram bot started with polling")
 
@@ -58,7 +383,9 @@ class TelegramBot:
             if self.application.updater:
                 await self.application.updater.start_polling(
                     drop_pending_updates=True,
-                    allowed_updates=Update.ALL_TYPES
+                    # Every handler (commands, private text, group auto-forwards)
+                    # works on plain messages; skip all other update types
+                    allowed_updates=[Update.MESSAGE]
                 )
 
         except Exception as e:
@@ -71,8 +398,25 @@ class TelegramBot:
             if self.application.updater:
                 await self.application.updater.stop()
             await self.application.stop()
+
+            if self._job_flush_task:
+                self._job_flush_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await self._job_flush_task
+                self._job_flush_task = None
+            await self._flush_notification_jobs()
+
             await self.application.shutdown()
 
+            if self._last_seen_task:
+                self._last_seen_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await self._last_seen_task
+                self._last_seen_task = None
+            await self._flush_last_seen()
+
+            await self.mlb_client.__aexit__(None, None, None)
+
             logger.info("Telegram bot stopped")
 
         except Exception as e:
@@ -137,36 +481,62 @@ class TelegramBot:
 
     async def send_message_to_all_subscribers(self, message: str) -> int:
         """Send a message to all subscribed users."""
-        sent_count = 0
-
-        try:
-            async with self.db_session.get_session() as session:
-                repository = Repository(session)
-                users = await repository.get_subscribed_users()
-
-            for user in users:
-                try:
-                    success = await self._send_message_with_retry(
-                        chat_id=str(user.chat_id),
-                        message=message
-                    )
-
-                    if success:
-                        sent_count += 1
+        tasks: list[asyncio.Task[bool]] = []
 
-                except Exception as e:
+        async def send_one(chat_id: int) -> bool:
+            try:
+                return await self._send_message_with_retry(
+                    chat_id=str(chat_id),
+                    message=message
+                )
+            except Exception as e:
+                if _log_enabled(logging.WARNING):
                     logger.warning(
                         "Failed to send message to user",
-                        chat_id=user.chat_id,
+                        chat_id=chat_id,
                         error=str(e)
                     )
+                return False
+            finally:
+                self._send_semaphore.release()
+
+        try:
+            cache = self._subscriber_cache
+            if cache and monotonic() - cache[0] < _SUBSCRIBER_CACHE_TTL:
+                chat_ids = cache[1]
+            else:
+                # Read every chat ID up front so the read connection is returned
+                # before the rate-limited sends, remembering the IDs for next time
+                generation = self._subscriber_generation
+                async with self.db_session.read_session() as session:
+                    repository = Repository(session)
+                    chat_ids = [chat_id async for chat_id in repository.iter_subscribed_chat_ids()]
+
+                # Don't cache a list that a subscription change made stale mid-read
+                if generation == self._subscriber_generation:
+                    self._subscriber_cache = (monotonic(), chat_ids)
 
-            logger.info("Broadcast message sent", sent_count=sent_count, total_users=len(users))
-            return sent_count
+            for chat_id in chat_ids:
+                # The semaphore bounds how many sends are in flight
+                await self._send_semaphore.acquire()
+                tasks.append(asyncio.create_task(send_one(chat_id)))
 
         except Exception as e:
             logger.error("Error broadcasting message", error=str(e))
-            return sent_count
+
+        finally:
+            # Sends that already started are awaited and counted even if
+            # dispatching stopped early
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            sent_count = sum(1 for result in results if result is True)
+
+        logger.info(
+            "Broadcast message sent",
+            sent_count=sent_count,
+            failed_count=len(tasks) - sent_count,
+            total_users=len(tasks)
+        )
+        return sent_count
 
     def _setup_handlers(self) -> None:
         """Setup command and message handlers."""
@@ -176,18 +546,10 @@ class TelegramBot:
         self.application.add_handler(CommandHandler("status", self._handle_status))
         self.application.add_handler(CommandHandler("subscribe", self._handle_subscribe))
         self.application.add_handler(CommandHandler("unsubscribe", self._handle_unsubscribe))
-        self.application.add_handler(CommandHandler("next_game", self._handle_next_game))
-        self.application.add_handler(CommandHandler("nextgame", self._handle_next_game))
+        self.application.add_handler(CommandHandler(["next_game", "nextgame"], self._handle_next_game))
         self.application.add_handler(CommandHandler("transactions", self._handle_transactions))
         self.application.add_handler(CommandHandler("transaction_settings", self._handle_transaction_settings))
-        self.application.add_handler(CommandHandler("toggle_trades", self._handle_toggle_trades))
-        self.application.add_handler(CommandHandler("toggle_signings", self._handle_toggle_signings))
-        self.application.add_handler(CommandHandler("toggle_injuries", self._handle_toggle_injuries))
-        self.application.add_handler(CommandHandler("toggle_recalls", self._handle_toggle_recalls))
-        self.application.add_handler(CommandHandler("toggle_releases", self._handle_toggle_releases))
-        self.application.add_handler(CommandHandler("toggle_status_changes", self._handle_toggle_status_changes))
-        self.application.add_handler(CommandHandler("toggle_other", self._handle_toggle_other))
-        self.application.add_handler(CommandHandler("toggle_major_only", self._handle_toggle_major_only))
+        self.application.add_handler(CommandHandler(list(_TOGGLE_COMMANDS), self._handle_toggle))
 
         # Message handler for regular text - only respond in private chats
         self.application.add_handler(
@@ -219,32 +581,18 @@ class TelegramBot:
 
         try:
             # Create/update user record
-            user = User(
-                chat_id=update.effective_chat.id,
-                username=update.effective_user.username,
-                first_name=update.effective_user.first_name,
-                last_name=update.effective_user.last_name,
-            )
+            await self._upsert_user_profile(update, subscribed=True)
 
-            await self._save_user(user)
-
-            welcome_message = (
-                f"⚾ Welcome to the Seattle Mariners Gameday Bot, {user.display_name}!\n\n"
-                f"I'll notify you 5 minutes before each Mariners game starts with a direct link "
-                f"to MLB Gameday.\n\n"
-                f"Commands:\n"
-                f"• /help - Show this help message\n"
-                f"• /status - Check your subscription status\n"
-                f"• /subscribe - Subscribe to notifications\n"
-                f"• /unsubscribe - Unsubscribe from notifications\n"
-                f"• /nextgame or /next_game - Get info about the next game\n\n"
-                f"Go Mariners! 🌊"
-            )
+            welcome_message = WELCOME_TEMPLATE.format(name=update.effective_user.full_name)
 
             if update.message:
-                await update.message.reply_text(welcome_message, parse_mode=ParseMode.HTML)
+                await update.message.reply_text(welcome_message, parse_mode=ParseMode.HTML, disable_web_page_preview=True)
 
-            logger.info("User started bot", chat_id=update.effective_chat.id, username=user.username)
+            logger.info(
+                "User started bot",
+                chat_id=update.effective_chat.id,
+                username=update.effective_user.username
+            )
 
         except Exception as e:
             logger.error("Error handling start command", error=str(e))
@@ -253,40 +601,8 @@ class TelegramBot:
 
     async def _handle_help(self, update: Update, _context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /help command."""
-        help_message = (
-            "⚾ <b>Seattle Mariners Gameday Bot</b>\n\n"
-            "I automatically notify you 5 minutes before each Mariners game starts and "
-            "keep you updated on all Mariners transactions!\n\n"
-            "<b>Game Commands:</b>\n"
-            "• /start - Start using the bot\n"
-            "• /help - Show this help message\n"
-            "• /status - Check your subscription status\n"
-            "• /subscribe - Subscribe to notifications\n"
-            "• /unsubscribe - Unsubscribe from notifications\n"
-            "• /nextgame or /next_game - Get info about the next upcoming game\n\n"
-            "<b>Transaction Commands:</b>\n"
-            "• /transactions - View recent Mariners transactions\n"
-            "• /transaction_settings - View/manage transaction notification preferences\n"
-            "• /toggle_trades - Toggle trade notifications\n"
-            "• /toggle_signings - Toggle free agent signing notifications\n"
-            "• /toggle_injuries - Toggle injury list notifications\n"
-            "• /toggle_recalls - Toggle player recall/option notifications\n"
-            "• /toggle_releases - Toggle player release notifications\n"
-            "• /toggle_status_changes - Toggle status change notifications\n"
-            "• /toggle_other - Toggle other transaction notifications\n"
-            "• /toggle_major_only - Toggle major league only filter\n\n"
-            "<b>Features:</b>\n"
-            "• 🔔 Automatic notifications 5 minutes before games\n"
-            "• 📰 Real-time Mariners transaction alerts\n"
-            "• 🔗 Direct links to MLB Gameday\n"
-            "• 🏟️ Game details (opponent, venue, time)\n"
-            "• ⚙️ Customizable transaction notifications\n"
-            "• 🌍 Timezone-aware (Pacific Time)\n\n"
-            "Go Mariners! 🌊"
-        )
-
         if update.message:
-            await update.message.reply_text(help_message, parse_mode=ParseMode.HTML)
+            await update.message.reply_text(HELP_MESSAGE, parse_mode=ParseMode.HTML, disable_web_page_preview=True)
 
     async def _handle_status(self, update: Update, _context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /status command."""
@@ -294,26 +610,19 @@ class TelegramBot:
             return
 
         try:
-            async with self.db_session.get_session() as session:
-                # Check if user exists - simplified query
-                from sqlalchemy import select
-
-                from ..database.models import UserRecord
-
-                result = await session.execute(
-                    select(UserRecord).where(UserRecord.chat_id == update.effective_chat.id)
-                )
-                user_record = result.scalar_one_or_none()
+            async with self.db_session.read_session() as session:
+                repository = Repository(session)
+                subscribed = await repository.get_subscription_status(update.effective_chat.id)
 
-            if user_record and user_record.subscribed:
+            if subscribed:
                 status_message = "✅ You are <b>subscribed</b> to Mariners game notifications!"
-            elif user_record:
+            elif subscribed is not None:
                 status_message = "❌ You are <b>not subscribed</b> to notifications. Use /subscribe to enable them."
             else:
                 status_message = "❓ You haven't started the bot yet. Use /start to begin!"
 
             if update.message:
-                await update.message.reply_text(status_message, parse_mode=ParseMode.HTML)
+                await update.message.reply_text(status_message, parse_mode=ParseMode.HTML, disable_web_page_preview=True)
 
         except Exception as e:
             logger.error("Error checking user status", error=str(e))
@@ -326,25 +635,10 @@ class TelegramBot:
             return
 
         try:
-            user = User(
-                chat_id=update.effective_chat.id,
-                username=update.effective_user.username,
-                first_name=update.effective_user.first_name,
-                last_name=update.effective_user.last_name,
-                subscribed=True,
-            )
-
-            await self._save_user(user)
-
-            message = (
-                "✅ <b>Subscribed!</b>\n\n"
-                "You'll now receive notifications 5 minutes before each Mariners game starts. "
-                "I'll send you the game details and a direct link to MLB Gameday.\n\n"
-                "Use /unsubscribe if you want to stop receiving notifications."
-            )
+            await self._upsert_user_profile(update, subscribed=True)
 
             if update.message:
-                await update.message.reply_text(message, parse_mode=ParseMode.HTML)
+                await update.message.reply_text(SUBSCRIBE_MESSAGE, parse_mode=ParseMode.HTML, disable_web_page_preview=True)
 
             logger.info("User subscribed", chat_id=update.effective_chat.id)
 
@@ -359,25 +653,10 @@ class TelegramBot:
             return
 
         try:
-            user = User(
-                chat_id=update.effective_chat.id,
-                username=update.effective_user.username,
-                first_name=update.effective_user.first_name,
-                last_name=update.effective_user.last_name,
-                subscribed=False,
-            )
-
-            await self._save_user(user)
-
-            message = (
-                "❌ <b>Unsubscribed</b>\n\n"
-                "You won't receive game notifications anymore. "
-                "Use /subscribe if you want to re-enable them.\n\n"
-                "Thanks for using the Mariners bot! 🌊"
-            )
+            await self._upsert_user_profile(update, subscribed=False)
 
             if update.message:
-                await update.message.reply_text(message, parse_mode=ParseMode.HTML)
+                await update.message.reply_text(UNSUBSCRIBE_MESSAGE, parse_mode=ParseMode.HTML, disable_web_page_preview=True)
 
             logger.info("User unsubscribed", chat_id=update.effective_chat.id)
 
@@ -388,23 +667,16 @@ class TelegramBot:
 
     async def _handle_next_game(self, update: Update, _context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /next_game command."""
-        from datetime import datetime, timedelta
-
-        from opentelemetry import trace
-
-        from ..observability import get_tracer
-        tracer = get_tracer("mariners-bot.telegram")
+        # Nothing to reply to; skip the DB and MLB API work entirely
+        if not update.effective_chat or not update.message:
+            return
 
-        with tracer.start_as_current_span("handle_next_game_command") as span:
+        with _TRACER.start_as_current_span("handle_next_game_command") as span:
             span.set_attribute("command", "nextgame")
-            span.set_attribute("user.chat_id", str(update.effective_chat.id) if update.effective_chat else "unknown")
+            span.set_attribute("user.chat_id", str(update.effective_chat.id))
 
             try:
-                async with self.db_session.get_session() as session:
-                    repository = Repository(session)
-                    # Check for current games first (within 2 hours of start)
-                    current_games = await repository.get_current_games(within_hours=2)
-                    upcoming_games = await repository.get_upcoming_games(limit=1)
+                current_games, upcoming_games = await self._get_next_game_lookup()
 
                 span.set_attribute("current_games_found", len(current_games))
                 span.set_attribute("upcoming_games_found", len(upcoming_games))
@@ -412,77 +684,16 @@ class TelegramBot:
                 if current_games:
                     # Show current game in progress
                     game = current_games[0]
+                    pitcher_task = asyncio.create_task(self._get_pitcher_info(game))
                     span.set_attribute("current_game.id", game.game_id)
                     span.set_attribute("current_game.opponent", game.opponent)
                     span.set_attribute("current_game.is_home", game.is_mariners_home)
 
-                    # Convert to Pacific time for display
-                    import pytz
-                    pt_timezone = pytz.timezone("America/Los_Angeles")
-                    game_time_pt = game.date.astimezone(pt_timezone)
-
-                    # Calculate how long ago the game started
-                    now_pt = datetime.now(pt_timezone)
-                    time_since_start = now_pt - game_time_pt
-
-                    # Determine if Mariners are home or away
-                    if game.is_mariners_home:
-                        matchup = f"<b>{game.opponent} @ Seattle Mariners</b>"
-                        location_emoji = "🏠"
-                        location_note = "Home Game"
-                    else:
-                        matchup = f"<b>Seattle Mariners @ {game.opponent}</b>"
-                        location_emoji = "✈️"
-                        location_note = "Away Game"
-
-                    # Format time since start
-                    if time_since_start < timedelta(minutes=1):
-                        time_status = "🚨 <b>STARTING NOW!</b>"
-                    elif time_since_start < timedelta(hours=1):
-                        minutes = int(time_since_start.total_seconds() / 60)
-                        time_status = f"🔴 <b>LIVE</b> - Started {minutes} min ago"
-                    else:
-                        hours = int(time_since_start.total_seconds() / 3600)
-                        minutes = int((time_since_start.total_seconds() % 3600) / 60)
-                        if minutes > 0:
-                            time_status = f"🔴 <b>LIVE</b> - Started {hours}h {minutes}m ago"
-                        else:
-                            time_status = f"🔴 <b>LIVE</b> - Started {hours}h ago"
-
-                    # Try to get pitching matchup
-                    pitcher_info = ""
-                    try:
-                        from ..clients import MLBClient
-                        async with MLBClient(self.settings) as mlb_client:
-                            pitchers = await mlb_client.get_probable_pitchers(game.game_id)
-                            if pitchers:
-                                if game.is_mariners_home:
-                                    mariners_pitcher = pitchers.get("home")
-                                    opponent_pitcher = pitchers.get("away")
-                                else:
-                                    mariners_pitcher = pitchers.get("away")
-                                    opponent_pitcher = pitchers.get("home")
-
-                                if mariners_pitcher and opponent_pitcher:
-                                    pitcher_info = f"🥎 <b>Pitching:</b> {mariners_pitcher} vs {opponent_pitcher}\n"
-                                elif mariners_pitcher:
-                                    pitcher_info = f"🥎 <b>Mariners Pitcher:</b> {mariners_pitcher}\n"
-                    except Exception as e:
-                        logger.warning("Failed to get pitcher information for current game", game_id=game.game_id, error=str(e))
+                    game_time_pt = _pt_display(game.date)[0]
+                    status_line = _format_time_since(datetime.now(_PT) - game_time_pt)
 
-                    message = (
-                        f"⚾ <b>Current Mariners Game</b>\n\n"
-                        f"🏟️ {matchup}\n"
-                        f"{location_emoji} {location_note}\n"
-                        f"{time_status}\n"
-                        f"{pitcher_info}\n"
-                        f"📅 <b>Started:</b> {game_time_pt.strftime('%A, %B %d, %Y')}\n"
-                        f"🕐 <b>First Pitch:</b> {game_time_pt.strftime('%I:%M %p %Z')}\n"
-                        f"📍 <b>Venue:</b> {game.venue}\n\n"
-                        f"<a href=\"{game.gameday_url}\">🔗 Watch LIVE on MLB Gameday</a>\n"
-                        f"<a href=\"{game.baseball_savant_url}\">📊 Advanced Analytics on Baseball Savant</a>\n\n"
-                        f"Go Mariners! 🌊⚾"
-                    )
+                    # Pitching matchup was fetched concurrently with the formatting above
+                    message = _format_game_message(game, True, status_line, await pitcher_task)
 
                 elif not upcoming_games:
                     message = (
@@ -493,146 +704,145 @@ class TelegramBot:
                     )
                 else:
                     game = upcoming_games[0]
+                    pitcher_task = asyncio.create_task(self._get_pitcher_info(game))
                     span.set_attribute("game.id", game.game_id)
                     span.set_attribute("game.opponent", game.opponent)
                     span.set_attribute("game.is_home", game.is_mariners_home)
 
-                    # Convert to Pacific time for display
-                    import pytz
-                    pt_timezone = pytz.timezone("America/Los_Angeles")
-                    game_time_pt = game.date.astimezone(pt_timezone)
-
-                    # Determine if Mariners are home or away
-                    if game.is_mariners_home:
-                        matchup = f"<b>{game.opponent} @ Seattle Mariners</b>"
-                        location_emoji = "🏠"
-                        location_note = "Home Game"
-                    else:
-                        matchup = f"<b>Seattle Mariners @ {game.opponent}</b>"
-                        location_emoji = "✈️"
-                        location_note = "Away Game"
-
                     # Calculate days until game (using Pacific Time for local context)
-                    now_pt_date = datetime.now(pt_timezone).date()
-                    game_date_pt = game_time_pt.date()
-                    days_until = (game_date_pt - now_pt_date).days
+                    game_time_pt = _pt_display(game.date)[0]
+                    days_until = (game_time_pt.date() - datetime.now(_PT).date()).days
                     span.set_attribute("game.days_until", days_until)
+                    status_line = _format_days_until(days_until)
 
-                    if days_until == 0:
-                        time_note = "🔥 <b>TODAY!</b>"
-                    elif days_until == 1:
-                        time_note = "📅 <b>Tomorrow</b>"
-                    elif days_until <= 7:
-                        time_note = f"📅 In {days_until} days"
-                    else:
-                        time_note = f"📅 In {days_until} days"
-
-                    # Try to get pitching matchup
-                    pitcher_info = ""
-                    try:
-                        from ..clients import MLBClient
-                        async with MLBClient(self.settings) as mlb_client:
-                            pitchers = await mlb_client.get_probable_pitchers(game.game_id)
-                            if pitchers:
-                                if game.is_mariners_home:
-                                    mariners_pitcher = pitchers.get("home")
-                                    opponent_pitcher = pitchers.get("away")
-                                else:
-                                    mariners_pitcher = pitchers.get("away")
-                                    opponent_pitcher = pitchers.get("home")
-
-                                if mariners_pitcher and opponent_pitcher:
-                                    pitcher_info = f"🥎 <b>Pitching:</b> {mariners_pitcher} vs {opponent_pitcher}\n"
-                                elif mariners_pitcher:
-                                    pitcher_info = f"🥎 <b>Mariners Pitcher:</b> {mariners_pitcher}\n"
-                    except Exception as e:
-                        logger.warning("Failed to get pitcher information for upcoming game", game_id=game.game_id, error=str(e))
-
-                    message = (
-                        f"⚾ <b>Next Mariners Game</b>\n\n"
-                        f"🏟️ {matchup}\n"
-                        f"{location_emoji} {location_note}\n"
-                        f"{time_note}\n"
-                        f"{pitcher_info}\n"
-                        f"📅 <b>Date:</b> {game_time_pt.strftime('%A, %B %d, %Y')}\n"
-                        f"🕐 <b>Time:</b> {game_time_pt.strftime('%I:%M %p %Z')}\n"
-                        f"📍 <b>Venue:</b> {game.venue}\n\n"
-                        f"<a href=\"{game.gameday_url}\">🔗 Watch on MLB Gameday</a>\n"
-                        f"<a href=\"{game.baseball_savant_url}\">📊 Advanced Analytics on Baseball Savant</a>\n\n"
-                        f"I'll send a notification 5 minutes before first pitch! 🚨"
-                    )
+                    # Pitching matchup was fetched concurrently with the formatting above
+                    message = _format_game_message(game, False, status_line, await pitcher_task)
 
-                if update.message:
-                    await update.message.reply_text(message, parse_mode=ParseMode.HTML, disable_web_page_preview=True)
+                await update.message.reply_text(message, parse_mode=ParseMode.HTML, disable_web_page_preview=True)
 
             except Exception as e:
                 span.record_exception(e)
                 span.set_status(trace.StatusCode.ERROR, str(e))
                 logger.error("Error getting next game", error=str(e))
-                if update.message:
-                    await update.message.reply_text("Sorry, I couldn't get the next game info right now.")
+                await update.message.reply_text("Sorry, I couldn't get the next game info right now.")
+
+    async def _get_next_game_lookup(self) -> tuple[list[Game], list[Game]]:
+        """Get (current games, next upcoming game), cached briefly across users."""
+        cache = self._next_game_cache
+        if cache and monotonic() - cache[0] < _NEXT_GAME_CACHE_TTL:
+            return cache[1]
+
+        async with self._next_game_lock:
+            # Another caller may have refreshed the cache while we waited
+            cache = self._next_game_cache
+            if cache and monotonic() - cache[0] < _NEXT_GAME_CACHE_TTL:
+                return cache[1]
+
+            async with self.db_session.read_session() as session:
+                repository = Repository(session)
+                # Check for current games first (within 2 hours of start)
+                current_games = await repository.get_current_games(within_hours=2)
+                upcoming_games = await repository.get_upcoming_games(limit=1)
+
+            result = (current_games, upcoming_games)
+            self._next_game_cache = (monotonic(), result)
+            return result
+
+    async def _get_pitcher_info(self, game: Game) -> str:
+        """Get the formatted pitching matchup line for a game, or "" if unavailable."""
+        cached = self._pitcher_cache.get(game.game_id)
+        if cached and monotonic() - cached[0] < _PITCHER_CACHE_TTL:
+            pitchers: dict[str, str] | None = cached[1]
+        else:
+            try:
+                pitchers = await asyncio.wait_for(
+                    self.mlb_client.get_probable_pitchers(game.game_id),
+                    timeout=_PITCHER_FETCH_TIMEOUT
+                )
+            except Exception as e:
+                logger.warning("Failed to get pitcher information", game_id=game.game_id, error=str(e))
+                return ""
+
+            if pitchers:
+                self._pitcher_cache[game.game_id] = (monotonic(), pitchers)
+
+        if not pitchers:
+            return ""
+
+        if game.is_mariners_home:
+            mariners_pitcher = pitchers.get("home")
+            opponent_pitcher = pitchers.get("away")
+        else:
+            mariners_pitcher = pitchers.get("away")
+            opponent_pitcher = pitchers.get("home")
+
+        if mariners_pitcher and opponent_pitcher:
+            return f"🥎 <b>Pitching:</b> {mariners_pitcher} vs {opponent_pitcher}\n"
+        elif mariners_pitcher:
+            return f"🥎 <b>Mariners Pitcher:</b> {mariners_pitcher}\n"
+        return ""
 
     async def _handle_message(self, update: Update, _context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle regular messages."""
         if not update.effective_user:
             return
 
-        # Update user's last seen time
-        try:
-            if update.effective_user and update.effective_chat:
-                user = User(
-                    chat_id=update.effective_chat.id,
-                    username=update.effective_user.username,
-                    first_name=update.effective_user.first_name,
-                    last_name=update.effective_user.last_name,
-                )
-                user.update_last_seen()
-                await self._save_user(user)
-        except Exception as e:
-            logger.warning("Failed to update user last seen", error=str(e))
-
-        # Send helpful response
-        response = (
-            "⚾ Thanks for your message! I'm here to notify you about Mariners games.\n\n"
-            "Use /help to see what I can do, or /next_game to check the upcoming schedule!"
-        )
+        # Record the user's last seen time; written out by _flush_last_seen
+        if update.effective_chat:
+            self._pending_last_seen[update.effective_chat.id] = datetime.now(UTC)
 
         if update.message:
-            await update.message.reply_text(response)
+            await update.message.reply_text(DEFAULT_REPLY)
 
     async def _send_message_with_retry(
         self,
         chat_id: str,
         message: str,
-        max_retries: int = 3
+        max_retries: int = 3,
+        disable_web_page_preview: bool = True,
     ) -> bool:
         """Send a message with retry logic for rate limiting."""
+        group_limiter = self._get_group_limiter(chat_id)
+        send_kwargs: dict[str, Any] = {
+            "chat_id": chat_id,
+            "text": message,
+            "parse_mode": ParseMode.HTML,
+            "disable_web_page_preview": disable_web_page_preview,
+        }
+
         for attempt in range(max_retries):
             try:
-                await self.bot.send_message(
-                    chat_id=chat_id,
-                    text=message,
-                    parse_mode=ParseMode.HTML,
-                    disable_web_page_preview=True
-                )
+                await self._sends_open.wait()
+                if group_limiter:
+                    await group_limiter.acquire()
+                await self._global_limiter.acquire()
+
+                await self.bot.send_message(**send_kwargs)
+                self._global_limiter.on_success()
                 return True
 
             except RetryAfter as e:
-                # Telegram rate limiting
+                # Telegram rate limiting; the limiters should make this rare
+                self._global_limiter.on_congestion()
                 # Handle both int and timedelta types for retry_after
                 if isinstance(e.retry_after, int):
-                    wait_time = e.retry_after + 1
+                    retry_after = e.retry_after
                 else:
-                    wait_time = int(e.retry_after.total_seconds()) + 1  # Add 1 second buffer
-                logger.warning(
-                    "Rate limited by Telegram",
-                    chat_id=chat_id,
-                    wait_time=wait_time,
-                    attempt=attempt + 1
-                )
+                    retry_after = int(e.retry_after.total_seconds())
+                # Honor the server's delay, plus a jittered buffer so paused
+                # senders don't all resume on the same tick
+                wait_time = min(retry_after, _MAX_RETRY_AFTER_WAIT) + random.uniform(0.5, 1.5)
+                self._pause_sends(wait_time)
+                if _log_enabled(logging.WARNING):
+                    logger.warning(
+                        "Rate limited by Telegram",
+                        chat_id=chat_id,
+                        wait_time=round(wait_time, 2),
+                        attempt=attempt + 1
+                    )
 
                 if attempt < max_retries - 1:
-                    await asyncio.sleep(wait_time)
+                    # The next attempt waits on the shared gate
                     continue
                 else:
                     logger.error("Max retries exceeded for rate limit", chat_id=chat_id)
@@ -647,7 +857,10 @@ class TelegramBot:
                 )
 
                 if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                    # Full-jitter exponential backoff: concurrent failures
+                    # spread out instead of retrying in lockstep
+                    backoff = _ERROR_BACKOFFS[min(attempt, len(_ERROR_BACKOFFS) - 1)]
+                    await asyncio.sleep(random.uniform(0, backoff))
                     continue
                 else:
                     return False
@@ -663,17 +876,90 @@ class TelegramBot:
 
         return False
 
-    async def _save_user(self, user: User) -> None:
-        """Save user to database."""
+    def _pause_sends(self, delay: float) -> None:
+        """Close the shared send gate for ``delay`` seconds, extending any current pause."""
+        reopen_at = monotonic() + delay
+        if reopen_at <= self._sends_reopen_at:
+            return
+
+        self._sends_reopen_at = reopen_at
+        self._sends_open.clear()
+        if self._sends_reopen_handle:
+            self._sends_reopen_handle.cancel()
+        self._sends_reopen_handle = asyncio.get_running_loop().call_later(delay, self._sends_open.set)
+
+    def _get_group_limiter(self, chat_id: str) -> TokenBucket | None:
+        """Get the per-chat limiter for a group or channel, or None for private chats.
+
+        Group and channel IDs are negative (or an @username); private chats
+        receive at most one message per broadcast and need no bucket.
+        """
+        if not chat_id.startswith(("-", "@")):
+            return None
+
+        limiter = self._group_limiters.get(chat_id)
+        if limiter is None:
+            limiter = self._group_limiters[chat_id] = TokenBucket(_GROUP_SEND_RATE_PER_MINUTE, 60)
+        return limiter
+
+    async def _run_last_seen_flusher(self) -> None:
+        """Periodically flush buffered last_seen updates until cancelled."""
+        while True:
+            await asyncio.sleep(_LAST_SEEN_FLUSH_INTERVAL)
+            await self._flush_last_seen()
+
+    async def _flush_last_seen(self) -> None:
+        """Write buffered last_seen updates to the database in one statement."""
+        if not self._pending_last_seen:
+            return
+
+        pending, self._pending_last_seen = self._pending_last_seen, {}
+        saved = False
+
+        try:
+            async with self.db_session.get_session() as session:
+                repository = Repository(session)
+                await repository.bulk_update_last_seen(pending)
+            saved = True
+
+        except Exception as e:
+            logger.warning("Failed to update user last seen", count=len(pending), error=str(e))
+
+        finally:
+            # Keep the updates for the next flush unless newer ones arrived meanwhile;
+            # this also covers the flusher being cancelled mid-write on shutdown
+            if not saved:
+                for chat_id, seen in pending.items():
+                    self._pending_last_seen.setdefault(chat_id, seen)
+
+    async def _upsert_user_profile(self, update: Update, subscribed: bool | None = None) -> None:
+        """Upsert the sender's profile fields and, if given, subscription flag."""
+        if not update.effective_user or not update.effective_chat:
+            return
+
         try:
             async with self.db_session.get_session() as session:
                 repository = Repository(session)
-                await repository.save_user(user)
+                await repository.upsert_user_profile(
+                    chat_id=update.effective_chat.id,
+                    username=update.effective_user.username,
+                    first_name=update.effective_user.first_name,
+                    last_name=update.effective_user.last_name,
+                    subscribed=subscribed,
+                )
+
+            if subscribed is not None:
+                self._invalidate_subscriber_cache()
 
         except Exception as e:
-            logger.error("Failed to save user", chat_id=user.chat_id, error=str(e))
+            logger.error("Failed to save user", chat_id=update.effective_chat.id, error=str(e))
             raise
 
+    def _invalidate_subscriber_cache(self) -> None:
+        """Drop the cached subscriber list after a subscription change."""
+        self._subscriber_cache = None
+        self._subscriber_generation += 1
+
     async def _mark_game_notified(self, game_id: str) -> None:
         """Mark a game's pre-game notification as sent in the database."""
         try:
@@ -685,14 +971,46 @@ class TelegramBot:
             logger.error("Failed to mark game as notified", game_id=game_id, error=str(e))
 
     async def _save_notification_job(self, job: NotificationJob) -> None:
-        """Save notification job to database."""
+        """Queue a notification job write for the next batched flush."""
+        self._job_buffer[job.job_id] = job
+
+        # Without a running flusher (e.g. one-off CLI commands) write straight away
+        if not self._job_flush_task or self._job_flush_task.done():
+            await self._flush_notification_jobs()
+        elif len(self._job_buffer) >= _JOB_FLUSH_BATCH_SIZE:
+            self._job_flush_event.set()
+
+    async def _run_job_flusher(self) -> None:
+        """Flush buffered notification jobs periodically until cancelled."""
+        while True:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._job_flush_event.wait(), timeout=_JOB_FLUSH_INTERVAL)
+            self._job_flush_event.clear()
+            await self._flush_notification_jobs()
+
+    async def _flush_notification_jobs(self) -> None:
+        """Write buffered notification jobs to the database in one transaction."""
+        if not self._job_buffer:
+            return
+
+        jobs, self._job_buffer = self._job_buffer, {}
+        saved = False
+
         try:
             async with self.db_session.get_session() as session:
                 repository = Repository(session)
-                await repository.save_notification_job(job)
+                await repository.save_notification_jobs(list(jobs.values()))
+            saved = True
 
         except Exception as e:
-            logger.error("Failed to save notification job", job_id=job.job_id, error=str(e))
+            logger.error("Failed to save notification jobs", count=len(jobs), error=str(e))
+
+        finally:
+            # Retry on the next flush unless a newer state was queued meanwhile;
+            # this also covers the flusher being cancelled mid-write on shutdown
+            if not saved:
+                for job_id, job in jobs.items():
+                    self._job_buffer.setdefault(job_id, job)
 
     async def _handle_transactions(self, update: Update, _context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /transactions command."""
@@ -700,19 +1018,14 @@ class TelegramBot:
             return
 
         try:
-            from datetime import date, timedelta
-
-            from ..clients import MLBClient
-
             # Get recent transactions (last 14 days)
             start_date = date.today() - timedelta(days=14)
             end_date = date.today()
 
-            async with MLBClient(self.settings) as mlb_client:
-                transactions = await mlb_client.get_mariners_transactions(
-                    start_date=start_date,
-                    end_date=end_date
-                )
+            transactions = await self.mlb_client.get_mariners_transactions(
+                start_date=start_date,
+                end_date=end_date
+            )
 
             if not transactions:
                 message = (
@@ -724,8 +1037,6 @@ class TelegramBot:
                 # Sort by date (newest first) and limit to 10
                 transactions.sort(key=lambda t: t.transaction_date, reverse=True)
                 recent_transactions = transactions[:10]
-
-                from ..models import Transaction
                 message = Transaction.format_batch_notification_message(recent_transactions)
 
             if update.message:
@@ -742,111 +1053,74 @@ class TelegramBot:
             return
 
         try:
-            async with self.db_session.get_session() as session:
-                repository = Repository(session)
-                preferences = await repository.get_user_transaction_preferences(update.effective_chat.id)
-
-            enabled_emoji = "✅"
-            disabled_emoji = "❌"
-
-            message = (
-                f"⚙️ <b>Transaction Notification Settings</b>\n\n"
-                f"<b>Current Preferences:</b>\n"
-                f"{enabled_emoji if preferences.trades else disabled_emoji} Trades\n"
-                f"{enabled_emoji if preferences.signings else disabled_emoji} Free Agent Signings\n"
-                f"{enabled_emoji if preferences.injuries else disabled_emoji} Injury List Moves\n"
-                f"{enabled_emoji if preferences.activations else disabled_emoji} Player Activations\n"
-                f"{enabled_emoji if preferences.recalls else disabled_emoji} Recalls & Options\n"
-                f"{enabled_emoji if preferences.releases else disabled_emoji} Player Releases\n"
-                f"{enabled_emoji if preferences.status_changes else disabled_emoji} Status Changes\n"
-                f"{enabled_emoji if preferences.other else disabled_emoji} Other Transactions\n\n"
-                f"<b>Filters:</b>\n"
-                f"{enabled_emoji if preferences.major_league_only else disabled_emoji} Major League Only\n\n"
-                f"<b>Quick Toggle Commands:</b>\n"
-                f"• /toggle_trades - Toggle trade notifications\n"
-                f"• /toggle_signings - Toggle signing notifications\n"
-                f"• /toggle_injuries - Toggle injury notifications\n"
-                f"• /toggle_recalls - Toggle recall/option notifications\n"
-                f"• /toggle_releases - Toggle release notifications\n"
-                f"• /toggle_status_changes - Toggle status change notifications\n"
-                f"• /toggle_other - Toggle other transaction notifications\n"
-                f"• /toggle_major_only - Toggle major league filter\n\n"
-                f"🌊 Go Mariners!"
+            preferences = await self._get_transaction_preferences(update.effective_chat.id)
+
+            preference_rows = "\n".join(
+                f"{'✅' if getattr(preferences, attr) else '❌'} {label}"
+                for attr, label in _PREFERENCE_ROWS
+            )
+            message = TRANSACTION_SETTINGS_TEMPLATE.format(
+                preference_rows=preference_rows,
+                major_league_only="✅" if preferences.major_league_only else "❌",
             )
 
             if update.message:
-                await update.message.reply_text(message, parse_mode=ParseMode.HTML)
+                await update.message.reply_text(message, parse_mode=ParseMode.HTML, disable_web_page_preview=True)
 
         except Exception as e:
             logger.error("Error getting transaction settings", error=str(e))
             if update.message:
                 await update.message.reply_text("Sorry, I couldn't get your transaction settings right now.")
 
-    async def _handle_toggle_trades(self, update: Update, _context: ContextTypes.DEFAULT_TYPE) -> None:
-        """Handle /toggle_trades command."""
-        await self._toggle_preference(update, "trades", "Trade")
-
-    async def _handle_toggle_signings(self, update: Update, _context: ContextTypes.DEFAULT_TYPE) -> None:
-        """Handle /toggle_signings command."""
-        await self._toggle_preference(update, "signings", "Free Agent Signing")
-
-    async def _handle_toggle_injuries(self, update: Update, _context: ContextTypes.DEFAULT_TYPE) -> None:
-        """Handle /toggle_injuries command."""
-        await self._toggle_preference(update, "injuries", "Injury List")
-
-    async def _handle_toggle_recalls(self, update: Update, _context: ContextTypes.DEFAULT_TYPE) -> None:
-        """Handle /toggle_recalls command."""
-        await self._toggle_preference(update, "recalls", "Recall/Option")
+    async def _handle_toggle(self, update: Update, _context: ContextTypes.DEFAULT_TYPE) -> None:
+        """Handle the /toggle_* commands."""
+        if not update.message or not update.message.text:
+            return
 
-    async def _handle_toggle_releases(self, update: Update, _context: ContextTypes.DEFAULT_TYPE) -> None:
-        """Handle /toggle_releases command."""
-        await self._toggle_preference(update, "releases", "Player Release")
+        # "/toggle_trades@SomeBot extra" -> "toggle_trades"
+        command = update.message.text.split(maxsplit=1)[0][1:].split("@", 1)[0].lower()
+        toggle = _TOGGLE_COMMANDS.get(command)
+        if toggle:
+            await self._toggle_preference(update, *toggle)
 
-    async def _handle_toggle_status_changes(self, update: Update, _context: ContextTypes.DEFAULT_TYPE) -> None:
-        """Handle /toggle_status_changes command."""
-        await self._toggle_preference(update, "status_changes", "Status Change")
+    async def _get_transaction_preferences(self, chat_id: int) -> UserTransactionPreferences:
+        """Get a chat's transaction preferences, cached briefly between commands."""
+        cached = self._preferences_cache.get(chat_id)
+        if cached and monotonic() - cached[0] < _PREFERENCES_CACHE_TTL:
+            return cached[1]
 
-    async def _handle_toggle_other(self, update: Update, _context: ContextTypes.DEFAULT_TYPE) -> None:
-        """Handle /toggle_other command."""
-        await self._toggle_preference(update, "other", "Other Transaction")
+        async with self.db_session.read_session() as session:
+            repository = Repository(session)
+            preferences = await repository.get_user_transaction_preferences(chat_id)
 
-    async def _handle_toggle_major_only(self, update: Update, _context: ContextTypes.DEFAULT_TYPE) -> None:
-        """Handle /toggle_major_only command."""
-        await self._toggle_preference(update, "major_league_only", "Major League Only")
+        self._preferences_cache[chat_id] = (monotonic(), preferences)
+        return preferences
 
     async def _toggle_preference(self, update: Update, preference_name: str, display_name: str) -> None:
         """Toggle a specific transaction preference."""
         if not update.effective_chat:
             return
 
+        chat_id = update.effective_chat.id
         try:
+            # The flip is done in SQL on the stored value, so it can't be lost
+            # to another toggle working from the same cached preferences
             async with self.db_session.get_session() as session:
                 repository = Repository(session)
+                preferences = await repository.toggle_user_transaction_preference(chat_id, preference_name)
 
-                # Get current preferences
-                preferences = await repository.get_user_transaction_preferences(update.effective_chat.id)
-
-                # Toggle the preference
-                current_value = getattr(preferences, preference_name)
-                setattr(preferences, preference_name, not current_value)
-
-                # Save updated preferences
-                await repository.save_user_transaction_preferences(preferences)
-
-                # Send confirmation
-                new_value = not current_value
-                status = "enabled" if new_value else "disabled"
-                emoji = "✅" if new_value else "❌"
+            self._preferences_cache[chat_id] = (monotonic(), preferences)
 
-                message = (
-                    f"⚙️ <b>Settings Updated</b>\n\n"
-                    f"{emoji} <b>{display_name}</b> notifications are now <b>{status}</b>.\n\n"
-                    f"Use /transaction_settings to see all your preferences.\n\n"
-                    f"🌊 Go Mariners!"
-                )
+            # Send confirmation
+            new_value = getattr(preferences, preference_name)
+            message = PREFERENCE_UPDATED_TEMPLATE.format(
+                emoji="✅" if new_value else "❌",
+                display_name=display_name,
+                status="enabled" if new_value else "disabled",
+            )
 
-                if update.message:
-                    await update.message.reply_text(message, parse_mode=ParseMode.HTML)
+            if update.message:
+                await update.message.reply_text(message, parse_mode=ParseMode.HTML, disable_web_page_preview=True)
 
         except Exception as e:
             logger.error("Error toggling preference", preference=preference_name, error=str(e))
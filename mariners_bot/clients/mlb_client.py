@@ -1,17 +1,81 @@
 """MLB Stats API client."""
 
+import asyncio
+import functools
+import operator
 from datetime import UTC, date, datetime
+from itertools import chain
+from time import monotonic
 from typing import Any
 
 import aiohttp
 import structlog
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from ..config import Settings
 from ..models import Game, GameStatus, GameType, Transaction
 
 logger = structlog.get_logger(__name__)
 
+# Game types fetched without a teamId filter (see get_team_schedule)
+_POSTSEASON_GAME_TYPES = frozenset({'P', 'D', 'L', 'F', 'W'})
+
+# Retries after the first attempt for transient failures, with exponential
+# backoff between them (seconds)
+_REQUEST_RETRIES = 2
+_RETRY_MIN_WAIT = 4
+_RETRY_MAX_WAIT = 10
+
+# Seconds to reuse a response for slow-changing lookups on a long-lived client
+_SCHEDULE_CACHE_TTL = 300
+_TRANSACTIONS_CACHE_TTL = 120
+
+# Cached responses to keep before expired entries are pruned
+_RESPONSE_CACHE_MAX_ENTRIES = 256
+
+# Sort key for games
+_by_date = operator.attrgetter("date")
+
+# MLB abstractGameCode -> GameStatus
+_STATUS_MAPPING: dict[str, GameStatus] = {
+    "S": GameStatus.SCHEDULED,  # Scheduled
+    "P": GameStatus.SCHEDULED,  # Pre-Game
+    "L": GameStatus.LIVE,       # Live
+    "F": GameStatus.FINAL,      # Final
+    "D": GameStatus.POSTPONED,  # Delayed/Postponed
+    "C": GameStatus.CANCELLED,  # Cancelled
+}
+
+# MLB gameType -> GameType
+_GAME_TYPE_MAPPING: dict[str, GameType] = {
+    "R": GameType.REGULAR,
+    "S": GameType.SPRING,
+    "P": GameType.POSTSEASON,
+    "D": GameType.DIVISION_SERIES,
+    "L": GameType.LEAGUE_CHAMPIONSHIP,
+    "F": GameType.CHAMPIONSHIP,
+    "W": GameType.WORLD_SERIES,
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_game_date(value: str) -> datetime:
+    """Parse an API gameDate such as "2025-09-07T16:05:00Z" to an aware UTC datetime.
+
+    fromisoformat accepts a trailing "Z" since Python 3.11. Offsets are
+    converted rather than overwritten, and naive values are taken as UTC. The
+    same game times recur on every schedule sync, so results are memoized.
+    """
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=UTC)
+    return parsed.astimezone(UTC)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_api_date(value: str) -> date:
+    """Parse an API date or datetime string to its calendar date."""
+    return datetime.fromisoformat(value).date()
+
 
 class MLBClient:
     """Client for the MLB Stats API."""
@@ -23,9 +87,23 @@ class MLBClient:
         self.team_id = settings.mariners_team_id
         self.session: aiohttp.ClientSession | None = None
 
+        # (endpoint, sorted params) -> (monotonic timestamp, response); the
+        # per-key locks make concurrent identical requests share one fetch
+        self._response_cache: dict[tuple[str, tuple[tuple[str, Any], ...]], tuple[float, dict[str, Any]]] = {}
+        self._request_locks: dict[tuple[str, tuple[tuple[str, Any], ...]], asyncio.Lock] = {}
+
     async def __aenter__(self) -> "MLBClient":
         """Async context manager entry."""
+        # Keep a small pool of warm connections to the Stats API instead of the
+        # default unbounded connector, and cache DNS for the long-lived session
+        connector = aiohttp.TCPConnector(
+            limit=20,
+            limit_per_host=8,
+            keepalive_timeout=30,
+            ttl_dns_cache=300,
+        )
         self.session = aiohttp.ClientSession(
+            connector=connector,
             timeout=aiohttp.ClientTimeout(total=30),
             headers={"User-Agent": "mariners-bot/0.1.0"}
         )
@@ -36,26 +114,39 @@ class MLBClient:
         if self.session:
             await self.session.close()
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10)
-    )
-    async def _make_request(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Make a request to the MLB API with retry logic."""
+    async def _get_json(self, url: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """GET a JSON document, retrying connection errors, timeouts and 5xx responses.
+
+        Client errors (4xx) are raised immediately since retrying can't fix them.
+        """
         if not self.session:
             raise RuntimeError("Client not initialized. Use async context manager.")
 
+        attempt = 0
+        while True:
+            try:
+                async with self.session.get(url, params=params) as response:
+                    response.raise_for_status()
+                    return await response.json()  # type: ignore[no-any-return]
+
+            except aiohttp.ClientResponseError as e:
+                if e.status < 500 or attempt >= _REQUEST_RETRIES:
+                    raise
+            except (aiohttp.ClientError, TimeoutError):
+                if attempt >= _REQUEST_RETRIES:
+                    raise
+
+            await asyncio.sleep(min(_RETRY_MAX_WAIT, _RETRY_MIN_WAIT * 2 ** attempt))
+            attempt += 1
+
+    async def _make_request(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Make a request to the MLB API with retry logic."""
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
 
-        logger.info("Making MLB API request", url=url, params=params)
+        logger.debug("Making MLB API request", url=url, params=params)
 
         try:
-            async with self.session.get(url, params=params) as response:
-                response.raise_for_status()
-                data = await response.json()
-
-                logger.info("MLB API request successful", status=response.status)
-                return data  # type: ignore[no-any-return]
+            return await self._get_json(url, params=params)
 
         except aiohttp.ClientError as e:
             logger.error("MLB API request failed", error=str(e), url=url)
@@ -64,6 +155,36 @@ class MLBClient:
             logger.error("MLB API request timed out", url=url)
             raise
 
+    async def _make_cached_request(
+        self, endpoint: str, params: dict[str, Any], ttl: float
+    ) -> dict[str, Any]:
+        """Make a request, reusing a response for the same endpoint and params within ``ttl`` seconds."""
+        key = (endpoint, tuple(sorted(params.items())))
+        cached = self._response_cache.get(key)
+        if cached and monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        lock = self._request_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another caller may have fetched it while we waited
+            cached = self._response_cache.get(key)
+            if cached and monotonic() - cached[0] < ttl:
+                return cached[1]
+
+            data = await self._make_request(endpoint, params=params)
+
+            now = monotonic()
+            if len(self._response_cache) >= _RESPONSE_CACHE_MAX_ENTRIES:
+                max_ttl = max(_SCHEDULE_CACHE_TTL, _TRANSACTIONS_CACHE_TTL)
+                self._response_cache = {
+                    k: v for k, v in self._response_cache.items() if now - v[0] < max_ttl
+                }
+            self._response_cache[key] = (now, data)
+
+        if not lock.locked():
+            self._request_locks.pop(key, None)
+        return data
+
     async def get_team_schedule(
         self,
         start_date: datetime | None = None,
@@ -87,25 +208,24 @@ class MLBClient:
         if game_types is None:
             game_types = ['R', 'S', 'P', 'D', 'L', 'F', 'W']  # Include all game types by default
 
-        all_games = []
+        # The schedule endpoint takes a comma-separated gameType list, and each
+        # game in the response carries its own gameType, so one request covers
+        # several types. Postseason types still get their own request without
+        # a teamId filter, because the API may not return postseason games when
+        # filtering by teamId
+        regular_types = [gt for gt in game_types if gt not in _POSTSEASON_GAME_TYPES]
+        postseason_types = [gt for gt in game_types if gt in _POSTSEASON_GAME_TYPES]
 
-        # Fetch games for each game type separately since API doesn't support multiple gameTypes
-        for game_type in game_types:
+        async def fetch_game_types(types: list[str], postseason: bool) -> list[Game]:
+            game_type = ",".join(types)
             try:
-                if game_type in ['P', 'D', 'L', 'F', 'W']:  # All postseason game types
-                    # For postseason games, we need to fetch all games and filter for Mariners
-                    # because the API may not return postseason games when filtering by teamId
-                    params = {
-                        "sportId": 1,  # MLB
-                        "gameType": game_type,
-                    }
-                else:
+                params: dict[str, Any] = {
+                    "sportId": 1,  # MLB
+                    "gameType": game_type,
+                }
+                if not postseason:
                     # For regular season and spring training, use teamId filter
-                    params = {
-                        "teamId": self.team_id,
-                        "sportId": 1,  # MLB
-                        "gameType": game_type,
-                    }
+                    params["teamId"] = self.team_id
 
                 if season:
                     params["season"] = season
@@ -120,33 +240,29 @@ class MLBClient:
                     params["endDate"] = end_date.strftime("%Y-%m-%d")
 
                 logger.debug("Fetching schedule", game_type=game_type, params=params)
-                data = await self._make_request("schedule", params=params)
-                games = self._parse_schedule_response(data, game_type)
-
-                # For postseason games, we need to filter for Mariners games since we fetched all teams
-                if game_type in ['P', 'D', 'L', 'F', 'W']:
-                    mariners_games = [game for game in games if game.is_mariners_game]
-                    all_games.extend(mariners_games)
-                    logger.debug("Fetched and filtered postseason games",
-                               game_type=game_type,
-                               total_games=len(games),
-                               mariners_games=len(mariners_games))
-                else:
-                    all_games.extend(games)
-                    logger.debug("Fetched games", game_type=game_type, count=len(games))
+                data = await self._make_cached_request("schedule", params, _SCHEDULE_CACHE_TTL)
+                # _parse_schedule_response keeps only Mariners games, which also
+                # filters the all-teams postseason response
+                games = self._parse_schedule_response(data, types[0])
+                logger.debug("Fetched games", game_type=game_type, count=len(games))
+                return games
 
             except Exception as e:
                 logger.warning("Failed to fetch schedule for game type",
                              game_type=game_type, error=str(e))
                 # Continue with other game types even if one fails
-                continue
+                return []
 
-        # Remove duplicates based on game_id and sort by date
-        unique_games = {}
-        for game in all_games:
-            unique_games[game.game_id] = game
+        requests = [
+            fetch_game_types(types, postseason)
+            for types, postseason in ((regular_types, False), (postseason_types, True))
+            if types
+        ]
+        results = await asyncio.gather(*requests)
 
-        sorted_games = sorted(unique_games.values(), key=lambda g: g.date)
+        # Remove duplicates based on game_id and sort by date
+        unique_games = {game.game_id: game for games in results for game in games}
+        sorted_games = sorted(unique_games.values(), key=_by_date)
 
         logger.info("Fetched complete schedule",
                    total_games=len(sorted_games),
@@ -162,7 +278,7 @@ class MLBClient:
         }
 
         try:
-            data = await self._make_request("schedule", params=params)
+            data = await self._make_cached_request("schedule", params, _SCHEDULE_CACHE_TTL)
             # For game details, we don't know the game type, so we'll try to infer it
             # from the response or default to regular season
             games = self._parse_schedule_response(data, "R")  # Default to regular season
@@ -237,7 +353,7 @@ class MLBClient:
         }
 
         try:
-            data = await self._make_request("schedule", params=params)
+            data = await self._make_cached_request("schedule", params, _SCHEDULE_CACHE_TTL)
 
             for date_entry in data.get("dates", []):
                 for game_data in date_entry.get("games", []):
@@ -253,67 +369,57 @@ class MLBClient:
 
     def _parse_probable_pitchers(self, game_data: dict[str, Any]) -> dict[str, str] | None:
         """Parse probable pitcher information from game data."""
-        try:
-            teams = game_data.get("teams", {})
-            pitchers = {}
-
-            # Get home pitcher
-            home_pitcher = (
-                teams.get("home", {})
-                .get("probablePitcher", {})
-                .get("fullName")
-            )
+        pitchers = {}
+        teams = game_data.get("teams")
 
-            # Get away pitcher
-            away_pitcher = (
-                teams.get("away", {})
-                .get("probablePitcher", {})
-                .get("fullName")
-            )
-
-            if home_pitcher:
-                pitchers["home"] = home_pitcher
-            if away_pitcher:
-                pitchers["away"] = away_pitcher
-
-            return pitchers if pitchers else None
+        for side in ("home", "away"):
+            # Index directly: a missing level is the exception, not the rule
+            try:
+                pitcher = teams[side]["probablePitcher"]["fullName"]  # type: ignore[index]
+            except (KeyError, TypeError):
+                continue
+            if pitcher:
+                pitchers[side] = pitcher
 
-        except Exception as e:
-            logger.warning("Failed to parse probable pitchers", error=str(e))
-            return None
+        return pitchers or None
 
     def _parse_schedule_response(self, data: dict[str, Any], game_type: str = "R") -> list[Game]:
         """Parse the MLB API schedule response into Game objects."""
-        games = []
-
-        for date_entry in data.get("dates", []):
-            for game_data in date_entry.get("games", []):
-                try:
-                    game = self._parse_game_data(game_data, game_type)
-                    if game and game.is_mariners_game:
-                        games.append(game)
-                except Exception as e:
-                    logger.warning(
-                        "Failed to parse game data",
-                        game_id=game_data.get("gamePk"),
-                        error=str(e)
-                    )
-                    continue
+        # Bound once; this runs for every game in a season-sized response
+        parse_game = self._parse_game_data
+        games: list[Game] = []
+        append = games.append
+
+        for game_data in chain.from_iterable(entry.get("games", ()) for entry in data.get("dates", ())):
+            try:
+                game = parse_game(game_data, game_type)
+            except Exception as e:
+                logger.warning(
+                    "Failed to parse game data",
+                    game_id=game_data.get("gamePk"),
+                    error=str(e)
+                )
+                continue
+
+            if game and game.is_mariners_game:
+                append(game)
 
         logger.info("Parsed schedule", total_games=len(games), game_type=game_type)
         return games
 
     def _parse_game_data(self, game_data: dict[str, Any], game_type: str = "R") -> Game | None:
-        """Parse individual game data from MLB API response."""
+        """Parse individual game data from MLB API response.
+
+        The game's own gameType wins over ``game_type``, which is only a fallback
+        for responses that omit it.
+        """
         try:
             # Extract basic game information
             game_id = str(game_data["gamePk"])
             game_date_str = game_data["gameDate"]
 
             # Parse the datetime (MLB API returns ISO format with timezone)
-            game_date = datetime.fromisoformat(
-                game_date_str.replace("Z", "+00:00")
-            ).replace(tzinfo=UTC)
+            game_date = _parse_game_date(game_date_str)
 
             # Extract team information
             teams = game_data["teams"]
@@ -334,7 +440,7 @@ class MLBClient:
                 away_team=away_team,
                 venue=venue,
                 status=status,
-                game_type=self._parse_game_type(game_type)  # Convert string to GameType enum
+                game_type=self._parse_game_type(game_data.get("gameType", game_type))  # Convert string to GameType enum
             )
 
         except (KeyError, ValueError, TypeError) as e:
@@ -343,54 +449,26 @@ class MLBClient:
 
     def _parse_game_status(self, status_code: str) -> GameStatus:
         """Parse MLB game status code to our GameStatus enum."""
-        status_mapping = {
-            "S": GameStatus.SCHEDULED,  # Scheduled
-            "P": GameStatus.SCHEDULED,  # Pre-Game
-            "L": GameStatus.LIVE,       # Live
-            "F": GameStatus.FINAL,      # Final
-            "D": GameStatus.POSTPONED,  # Delayed/Postponed
-            "C": GameStatus.CANCELLED,  # Cancelled
-        }
-
-        return status_mapping.get(status_code, GameStatus.SCHEDULED)
+        return _STATUS_MAPPING.get(status_code, GameStatus.SCHEDULED)
 
     def _parse_game_type(self, game_type: str) -> GameType:
         """Parse MLB game type string to our GameType enum."""
-        type_mapping = {
-            "R": GameType.REGULAR,
-            "S": GameType.SPRING,
-            "P": GameType.POSTSEASON,
-            "D": GameType.DIVISION_SERIES,
-            "L": GameType.LEAGUE_CHAMPIONSHIP,
-            "F": GameType.CHAMPIONSHIP,
-            "W": GameType.WORLD_SERIES,
-        }
-
-        return type_mapping.get(game_type, GameType.REGULAR)
+        return _GAME_TYPE_MAPPING.get(game_type, GameType.REGULAR)
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10)
-    )
     async def get_live_game_feed(self, game_pk: int) -> dict[str, Any] | None:
         """Fetch the live game feed from the MLB Stats API v1.1 endpoint.
 
         This is a separate endpoint from the base v1 API and returns real-time
         play-by-play data including allPlays, linescore, and game state.
         """
-        if not self.session:
-            raise RuntimeError("Client not initialized. Use async context manager.")
-
         url = f"https://statsapi.mlb.com/api/v1.1/game/{game_pk}/feed/live"
 
         logger.debug("Fetching live game feed", game_pk=game_pk)
 
         try:
-            async with self.session.get(url) as response:
-                response.raise_for_status()
-                data = await response.json()
-                logger.debug("Live game feed fetched", game_pk=game_pk)
-                return data  # type: ignore[no-any-return]
+            data = await self._get_json(url)
+            logger.debug("Live game feed fetched", game_pk=game_pk)
+            return data
 
         except aiohttp.ClientError as e:
             logger.error("Failed to fetch live game feed", game_pk=game_pk, error=str(e))
@@ -418,7 +496,7 @@ class MLBClient:
             params["endDate"] = end_date.isoformat()
 
         try:
-            data = await self._make_request("transactions", params=params)
+            data = await self._make_cached_request("transactions", params, _TRANSACTIONS_CACHE_TTL)
             return self._parse_transactions_response(data)
 
         except Exception as e:
@@ -439,13 +517,13 @@ class MLBClient:
 
     def _parse_transactions_response(self, data: dict[str, Any]) -> list[Transaction]:
         """Parse the MLB API transactions response into Transaction objects."""
-        transactions = []
+        parse_transaction = self._parse_transaction_data
+        transactions: list[Transaction] = []
+        append = transactions.append
 
-        for transaction_data in data.get("transactions", []):
+        for transaction_data in data.get("transactions", ()):
             try:
-                transaction = self._parse_transaction_data(transaction_data)
-                if transaction:
-                    transactions.append(transaction)
+                transaction = parse_transaction(transaction_data)
             except Exception as e:
                 logger.warning(
                     "Failed to parse transaction data",
@@ -454,6 +532,9 @@ class MLBClient:
                 )
                 continue
 
+            if transaction:
+                append(transaction)
+
         logger.info("Parsed transactions", total_transactions=len(transactions))
         return transactions
 
@@ -485,21 +566,15 @@ class MLBClient:
                 to_team_name = to_team["name"]
 
             # Date information
-            transaction_date = datetime.fromisoformat(
-                transaction_data["date"]
-            ).date()
+            transaction_date = _parse_api_date(transaction_data["date"])
 
             effective_date = None
             if "effectiveDate" in transaction_data:
-                effective_date = datetime.fromisoformat(
-                    transaction_data["effectiveDate"]
-                ).date()
+                effective_date = _parse_api_date(transaction_data["effectiveDate"])
 
             resolution_date = None
             if "resolutionDate" in transaction_data:
-                resolution_date = datetime.fromisoformat(
-                    transaction_data["resolutionDate"]
-                ).date()
+                resolution_date = _parse_api_date(transaction_data["resolutionDate"])
 
             # Transaction type and description
             type_code = transaction_data["typeCode"]
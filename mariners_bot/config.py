@@ -1,8 +1,10 @@
 """Configuration management for the Mariners bot."""
 
+import functools
+import os
 
 from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -11,6 +13,7 @@ class Settings(BaseSettings):
     # Telegram Bot Configuration
     telegram_bot_token: str = Field(default="")
     telegram_chat_id: str | None = Field(default=None)
+    telegram_send_concurrency: int = Field(default=25)  # Max in-flight sends during broadcasts
 
     # MLB API Configuration
     mlb_api_base_url: str = Field(default="https://statsapi.mlb.com/api/v1")
@@ -18,6 +21,13 @@ class Settings(BaseSettings):
 
     # Database Configuration
     database_url: str = Field(default="sqlite:///data/mariners_bot.db")
+    # PRAGMAs run on every new SQLite connection, in 'name=value,name2=value2' format
+    sqlite_pragmas: str = Field(
+        default=(
+            "journal_mode=WAL,synchronous=NORMAL,temp_store=MEMORY,"
+            "mmap_size=268435456,cache_size=-64000,busy_timeout=5000"
+        )
+    )
 
     # Scheduler Configuration
     scheduler_timezone: str = Field(default="America/Los_Angeles")
@@ -30,9 +40,15 @@ class Settings(BaseSettings):
     otel_traces_exporter: str = Field(default="none")  # none, console, otlp
     otel_exporter_otlp_endpoint: str = Field(default="")  # e.g. https://api.honeycomb.io
     otel_exporter_otlp_headers: str = Field(default="")   # key=value,key2=value2
+    otel_traces_sample_ratio: float = Field(default=1.0)  # Fraction of new traces to record (0.0-1.0)
 
     # Health Check Configuration
     health_check_port: int = Field(default=8000)
+    health_access_log: bool = Field(default=False)  # Log every request to the health server
+    health_cache_ttl: float = Field(default=1.0)  # Seconds to reuse an assembled health response
+    health_db_activity_window: float = Field(default=10.0)  # Skip DB ping if app committed this recently
+    health_check_db_timeout: float = Field(default=1.0)  # Seconds before a DB ping counts as failed
+    health_sampler_interval: float = Field(default=2.0)  # Seconds between system metric samples
 
     # Play-by-play channel configuration
     playbyplay_channel_id: str | None = Field(default=None)       # Channel for inning header posts
@@ -49,21 +65,23 @@ class Settings(BaseSettings):
     debug: bool = Field(default=False)
     environment: str = Field(default="production")
 
-    model_config = {
-        "env_file": ".env",
-        "env_file_encoding": "utf-8",
-        "case_sensitive": False,
-    }
-
-
-
-# Global settings instance
-_settings: Settings | None = None
+    model_config = SettingsConfigDict(
+        # Deployments that inject ENVIRONMENT=production (docker-compose,
+        # systemd) already carry the full env, so skip reading .env there
+        env_file=None if os.environ.get("ENVIRONMENT", "").lower() == "production" else ".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        # Shared process-wide via get_settings(); frozen so it can't drift at
+        # runtime and can be hashed into cache keys
+        frozen=True,
+    )
 
 
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get the global settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    """Get the global settings instance.
+
+    Cached so every caller shares one instance; use ``get_settings.cache_clear()``
+    to force a reload.
+    """
+    return Settings()
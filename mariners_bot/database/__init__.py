@@ -2,7 +2,12 @@
 
 from .models import Base, GameRecord, NotificationJobRecord, UserRecord
 from .repository import Repository
-from .session import DatabaseSession, get_database_session
+from .session import (
+    DatabaseSession,
+    get_async_database_url,
+    get_database_session,
+    get_pool_options,
+)
 
 __all__ = [
     "Base",
@@ -11,5 +16,7 @@ __all__ = [
     "UserRecord",
     "Repository",
     "DatabaseSession",
+    "get_async_database_url",
     "get_database_session",
+    "get_pool_options",
 ]
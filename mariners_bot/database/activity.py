@@ -0,0 +1,18 @@
+"""Process-wide record of the last successful database interaction."""
+
+from time import monotonic
+
+# Monotonic timestamp of the most recent committed session, or None if the
+# application has not talked to the database yet.
+_last_success: float | None = None
+
+
+def touch() -> None:
+    """Record that a database session just committed successfully."""
+    global _last_success
+    _last_success = monotonic()
+
+
+def last() -> float | None:
+    """Return the monotonic timestamp of the last successful interaction."""
+    return _last_success
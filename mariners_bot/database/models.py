@@ -4,10 +4,21 @@
 from __future__ import annotations
 
 from datetime import datetime  # noqa: TC003
+from enum import Enum, IntFlag
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text, UniqueConstraint
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from sqlalchemy.sql import func
+from sqlalchemy.sql import ColumnElement, func
+
+from ..models.game import GameStatus
+from ..models.notification import NotificationStatus
+
+
+def _status_enum(enum_cls: type[Enum]) -> SAEnum:
+    """Map a status enum onto a plain string column holding its values."""
+    return SAEnum(enum_cls, native_enum=False, values_callable=lambda members: [m.value for m in members])
 
 
 class Base(DeclarativeBase):
@@ -20,17 +31,23 @@ class GameRecord(Base):
 
     __tablename__ = "games"
 
-    game_id = Column(String, primary_key=True, index=True)
-    date = Column(DateTime(timezone=True), nullable=False, index=True)
-    home_team = Column(String, nullable=False)
-    away_team = Column(String, nullable=False)
-    venue = Column(String)
-    status = Column(String, default="scheduled")
-    game_type = Column(String, default="R", index=True)  # R=Regular, S=Spring, P=Postseason, W=World Series
-    notification_sent = Column(Boolean, default=False, index=True)
-    final_score_sent = Column(Boolean, default=False, index=True)
-    created_at = Column(DateTime(timezone=True), default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    game_id: Mapped[str] = mapped_column(String, primary_key=True, index=True)
+    date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+    home_team: Mapped[str] = mapped_column(String, nullable=False)
+    away_team: Mapped[str] = mapped_column(String, nullable=False)
+    venue: Mapped[str | None] = mapped_column(String)
+    status: Mapped[GameStatus | None] = mapped_column(_status_enum(GameStatus), default=GameStatus.SCHEDULED)
+    game_type: Mapped[str | None] = mapped_column(String, default="R", index=True)  # R=Regular, S=Spring, P=Postseason, W=World Series
+    notification_sent: Mapped[bool | None] = mapped_column(Boolean, default=False)
+    final_score_sent: Mapped[bool | None] = mapped_column(Boolean, default=False, index=True)
+    created_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), onupdate=func.now())
+
+    # Partial index for the pre-game notification lookups, which only ever
+    # scan games that haven't been notified yet
+    __table_args__ = (
+        Index("ix_games_unnotified_date", "date", sqlite_where=notification_sent == False),  # noqa: E712
+    )
 
     def __repr__(self) -> str:
         """String representation of the game record."""
@@ -42,16 +59,23 @@ class NotificationJobRecord(Base):
 
     __tablename__ = "notification_jobs"
 
-    id = Column(String, primary_key=True, index=True)
-    game_id = Column(String, nullable=False, index=True)
-    scheduled_time = Column(DateTime(timezone=True), nullable=False, index=True)
-    message = Column(Text, nullable=False)
-    status = Column(String, default="pending", index=True)
-    chat_id = Column(String)
-    attempts = Column(Integer, default=0)
-    error_message = Column(Text)
-    created_at = Column(DateTime(timezone=True), default=func.now())
-    sent_at = Column(DateTime(timezone=True))
+    id: Mapped[str] = mapped_column(String, primary_key=True, index=True)
+    game_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    scheduled_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+    message: Mapped[str] = mapped_column(Text, nullable=False)
+    status: Mapped[NotificationStatus | None] = mapped_column(
+        _status_enum(NotificationStatus), default=NotificationStatus.PENDING
+    )
+    chat_id: Mapped[str | None] = mapped_column(String)
+    attempts: Mapped[int | None] = mapped_column(Integer, default=0)
+    error_message: Mapped[str | None] = mapped_column(Text)
+    created_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    sent_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+    # Serves the pending-jobs query's filter and ordering in one range scan
+    __table_args__ = (
+        Index("ix_notification_jobs_status_scheduled_time", "status", "scheduled_time"),
+    )
 
     def __repr__(self) -> str:
         """String representation of the notification job record."""
@@ -63,14 +87,14 @@ class UserRecord(Base):
 
     __tablename__ = "users"
 
-    chat_id = Column(Integer, primary_key=True, index=True)
-    username = Column(String)
-    first_name = Column(String)
-    last_name = Column(String)
-    subscribed = Column(Boolean, default=True, index=True)
-    timezone = Column(String, default="America/Los_Angeles")
-    created_at = Column(DateTime(timezone=True), default=func.now())
-    last_seen = Column(DateTime(timezone=True))
+    chat_id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    username: Mapped[str | None] = mapped_column(String)
+    first_name: Mapped[str | None] = mapped_column(String)
+    last_name: Mapped[str | None] = mapped_column(String)
+    subscribed: Mapped[bool | None] = mapped_column(Boolean, default=True, index=True)
+    timezone: Mapped[str | None] = mapped_column(String, default="America/Los_Angeles")
+    created_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    last_seen: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
     def __repr__(self) -> str:
         """String representation of the user record."""
@@ -82,55 +106,102 @@ class TransactionRecord(Base):
 
     __tablename__ = "transactions"
 
-    transaction_id = Column(Integer, primary_key=True, index=True)
-    person_id = Column(Integer, nullable=False, index=True)
-    person_name = Column(String, nullable=False)
+    transaction_id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    person_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    person_name: Mapped[str] = mapped_column(String, nullable=False)
 
-    from_team_id = Column(Integer, index=True)
-    from_team_name = Column(String)
-    to_team_id = Column(Integer, index=True)
-    to_team_name = Column(String)
+    from_team_id: Mapped[int | None] = mapped_column(Integer, index=True)
+    from_team_name: Mapped[str | None] = mapped_column(String)
+    to_team_id: Mapped[int | None] = mapped_column(Integer, index=True)
+    to_team_name: Mapped[str | None] = mapped_column(String)
 
-    transaction_date = Column(DateTime(timezone=True), nullable=False, index=True)
-    effective_date = Column(DateTime(timezone=True))
-    resolution_date = Column(DateTime(timezone=True))
+    transaction_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+    effective_date: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    resolution_date: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
-    type_code = Column(String, nullable=False, index=True)
-    type_description = Column(String, nullable=False)
-    description = Column(Text, nullable=False)
+    type_code: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    type_description: Mapped[str] = mapped_column(String, nullable=False)
+    description: Mapped[str] = mapped_column(Text, nullable=False)
 
-    notification_sent = Column(Boolean, default=False, index=True)
-    created_at = Column(DateTime(timezone=True), default=func.now())
+    notification_sent: Mapped[bool | None] = mapped_column(Boolean, default=False)
+    created_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_transactions_unsent_date", "transaction_date", sqlite_where=notification_sent == False),  # noqa: E712
+    )
 
     def __repr__(self) -> str:
         """String representation of the transaction record."""
         return f"<TransactionRecord(id={self.transaction_id}, player={self.person_name}, type={self.type_code})>"
 
 
+class TransactionPreferenceFlag(IntFlag):
+    """Bit for each transaction type preference in preferences_mask."""
+
+    TRADES = 1
+    SIGNINGS = 2
+    RECALLS = 4
+    OPTIONS = 8
+    INJURIES = 16
+    ACTIVATIONS = 32
+    RELEASES = 64
+    STATUS_CHANGES = 128
+    OTHER = 256
+
+
+DEFAULT_TRANSACTION_PREFERENCES = int(
+    TransactionPreferenceFlag.TRADES
+    | TransactionPreferenceFlag.SIGNINGS
+    | TransactionPreferenceFlag.RECALLS
+    | TransactionPreferenceFlag.OPTIONS
+    | TransactionPreferenceFlag.INJURIES
+    | TransactionPreferenceFlag.ACTIVATIONS
+)
+
+
+def _preference_flag(flag: TransactionPreferenceFlag) -> hybrid_property[bool]:
+    """Expose one preferences_mask bit as a boolean attribute and SQL expression."""
+
+    def get(self: UserTransactionPreference) -> bool:
+        return bool(self.preferences_mask & flag)
+
+    def expression(cls: type[UserTransactionPreference]) -> ColumnElement[bool]:
+        return cls.preferences_mask.op("&")(int(flag)) != 0
+
+    return hybrid_property(get, expr=expression)
+
+
 class UserTransactionPreference(Base):
     """SQLAlchemy model for user transaction notification preferences."""
 
     __tablename__ = "user_transaction_preferences"
 
-    id = Column(Integer, primary_key=True, index=True)
-    chat_id = Column(Integer, nullable=False, index=True)
-
-    # Transaction type preferences
-    trades = Column(Boolean, default=True)
-    signings = Column(Boolean, default=True)
-    recalls = Column(Boolean, default=True)
-    options = Column(Boolean, default=True)
-    injuries = Column(Boolean, default=True)
-    activations = Column(Boolean, default=True)
-    releases = Column(Boolean, default=False)
-    status_changes = Column(Boolean, default=False)
-    other = Column(Boolean, default=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    chat_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True, unique=True)
+
+    # Transaction type preferences, one TransactionPreferenceFlag bit each
+    preferences_mask: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=DEFAULT_TRANSACTION_PREFERENCES,
+        server_default=str(DEFAULT_TRANSACTION_PREFERENCES),
+    )
+
+    trades = _preference_flag(TransactionPreferenceFlag.TRADES)
+    signings = _preference_flag(TransactionPreferenceFlag.SIGNINGS)
+    recalls = _preference_flag(TransactionPreferenceFlag.RECALLS)
+    options = _preference_flag(TransactionPreferenceFlag.OPTIONS)
+    injuries = _preference_flag(TransactionPreferenceFlag.INJURIES)
+    activations = _preference_flag(TransactionPreferenceFlag.ACTIVATIONS)
+    releases = _preference_flag(TransactionPreferenceFlag.RELEASES)
+    status_changes = _preference_flag(TransactionPreferenceFlag.STATUS_CHANGES)
+    other = _preference_flag(TransactionPreferenceFlag.OTHER)
 
     # Only major league transactions (vs minor league)
-    major_league_only = Column(Boolean, default=True)
+    major_league_only: Mapped[bool | None] = mapped_column(Boolean, default=True)
 
-    created_at = Column(DateTime(timezone=True), default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), onupdate=func.now())
 
     def __repr__(self) -> str:
         """String representation of the user preference record."""
@@ -147,7 +218,7 @@ class PlayByPlaySessionRecord(Base):
     game_pk: Mapped[int] = mapped_column(Integer, nullable=False)
     active: Mapped[bool] = mapped_column(Boolean, default=True, index=True)
     last_play_index: Mapped[int] = mapped_column(Integer, default=-1)
-    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=func.now())
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), server_default=func.now())
     finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     last_poll_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
@@ -167,7 +238,7 @@ class InningPostRecord(Base):
     channel_message_id: Mapped[int | None] = mapped_column(Integer, nullable=True)   # message_id in the channel
     group_message_id: Mapped[int | None] = mapped_column(Integer, nullable=True)     # thread-root message_id in the group
     footer_message_id: Mapped[int | None] = mapped_column(Integer, nullable=True)    # end-of-inning summary message_id
-    created_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=func.now())
+    created_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     __table_args__ = (UniqueConstraint("game_id", "inning", "half"),)
 
@@ -186,7 +257,7 @@ class PlayMessageRecord(Base):
     group_message_id: Mapped[int] = mapped_column(Integer, nullable=False)
     last_description: Mapped[str] = mapped_column(Text, nullable=False)
     last_event: Mapped[str] = mapped_column(String, nullable=False)
-    created_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=func.now())
+    created_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     __table_args__ = (UniqueConstraint("game_id", "at_bat_index"),)
 
@@ -1,19 +1,39 @@
-"""Repository layer for database operations."""
+"""Repository layer for database operations.
 
-from datetime import UTC, datetime, timedelta
+Rows read back from the database are turned into models with
+``model_construct``: the schema already enforced their types when they were
+written, so validation is skipped. Data from the MLB API is still validated
+when its models are first built in the client.
+"""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
 
 import structlog
-from sqlalchemy import and_, delete, select, update
+from sqlalchemy import Select, and_, bindparam, case, delete, func, not_, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-
-from ..models import Game, NotificationJob, Transaction, User, UserTransactionPreferences
+from sqlalchemy.sql import ColumnElement
+
+from ..models import (
+    Game,
+    GameStatus,
+    NotificationJob,
+    NotificationStatus,
+    Transaction,
+    UserTransactionPreferences,
+)
+from ..models.user_preferences import TRANSACTION_TYPE_PREFERENCES, is_minor_league_transaction
 from .models import (
+    DEFAULT_TRANSACTION_PREFERENCES,
     GameRecord,
     InningPostRecord,
     NotificationJobRecord,
     PlayByPlaySessionRecord,
     PlayMessageRecord,
+    TransactionPreferenceFlag,
     TransactionRecord,
     UserRecord,
     UserTransactionPreference,
@@ -21,6 +41,44 @@ from .models import (
 
 logger = structlog.get_logger(__name__)
 
+# Statements for hot per-command lookups, built once and executed with bound
+# parameters so each call skips statement construction and cache-key work
+_GET_SUBSCRIPTION_STMT: Select[Any] = (
+    select(UserRecord.subscribed).where(UserRecord.chat_id == bindparam("chat_id")).limit(1)
+)
+_GET_TRANSACTION_PREFERENCES_STMT = select(UserTransactionPreference).where(
+    UserTransactionPreference.chat_id == bindparam("chat_id")
+)
+
+
+def _as_date(value: datetime | None) -> date | None:
+    """Narrow a DateTime column value back to the date the model holds."""
+    return value.date() if value is not None else None
+
+
+def _preferences_mask(preferences: UserTransactionPreferences) -> int:
+    """Pack the per-type preference flags into a preferences_mask value."""
+    mask = 0
+    for flag in TransactionPreferenceFlag:
+        if getattr(preferences, flag.name.lower()):  # type: ignore[union-attr]
+            mask |= flag
+    return mask
+
+
+def _wants_transaction_type(transaction: Transaction) -> ColumnElement[bool]:
+    """SQL test for a user's preferences including the transaction's type.
+
+    Meant for queries outer-joining UserTransactionPreference: users who never
+    saved preferences are matched against the defaults.
+    """
+    flag = TransactionPreferenceFlag[
+        TRANSACTION_TYPE_PREFERENCES.get(transaction.transaction_type, "other").upper()
+    ]
+    preferences_mask = func.coalesce(
+        UserTransactionPreference.preferences_mask, DEFAULT_TRANSACTION_PREFERENCES
+    )
+    return preferences_mask.op("&")(int(flag)) != 0
+
 
 class Repository:
     """Repository for database operations."""
@@ -30,60 +88,44 @@ class Repository:
         self.session = session
 
     # Game operations
-    async def save_game(self, game: Game) -> None:
-        """Save or update a game record."""
-        try:
-            # Check if game already exists
-            result = await self.session.execute(
-                select(GameRecord).where(GameRecord.game_id == game.game_id)
-            )
-            existing_game = result.scalar_one_or_none()
-
-            if existing_game:
-                # Update existing game
-                existing_game.date = game.date  # type: ignore[assignment]
-                existing_game.home_team = game.home_team  # type: ignore[assignment]
-                existing_game.away_team = game.away_team  # type: ignore[assignment]
-                existing_game.venue = game.venue  # type: ignore[assignment]
-                existing_game.status = game.status.value  # type: ignore[assignment]
-                # notification_sent and final_score_sent are local state — never overwrite
-                existing_game.updated_at = datetime.now(UTC)  # type: ignore[assignment]
-
-                logger.debug("Updated existing game", game_id=game.game_id)
-            else:
-                # Create new game record
-                game_record = GameRecord(
-                    game_id=game.game_id,
-                    date=game.date,
-                    home_team=game.home_team,
-                    away_team=game.away_team,
-                    venue=game.venue,
-                    status=game.status.value,
-                    notification_sent=game.notification_sent,
-                    final_score_sent=game.final_score_sent,
-                )
-
-                self.session.add(game_record)
-                logger.debug("Created new game", game_id=game.game_id)
+    async def save_games(self, games: list[Game]) -> None:
+        """Insert or update several games with a single upsert statement."""
+        if not games:
+            return
 
-        except Exception as e:
-            logger.error("Failed to save game", game_id=game.game_id, error=str(e))
-            raise
-
-    async def get_game(self, game_id: str) -> Game | None:
-        """Get a game by ID."""
         try:
-            result = await self.session.execute(
-                select(GameRecord).where(GameRecord.game_id == game_id)
+            stmt = sqlite_insert(GameRecord).values([
+                {
+                    "game_id": game.game_id,
+                    "date": game.date,
+                    "home_team": game.home_team,
+                    "away_team": game.away_team,
+                    "venue": game.venue,
+                    "status": game.status,
+                    "notification_sent": game.notification_sent,
+                    "final_score_sent": game.final_score_sent,
+                }
+                for game in games
+            ])
+            # notification_sent and final_score_sent are local state — never overwrite
+            await self.session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[GameRecord.game_id],
+                    set_={
+                        "date": stmt.excluded.date,
+                        "home_team": stmt.excluded.home_team,
+                        "away_team": stmt.excluded.away_team,
+                        "venue": stmt.excluded.venue,
+                        "status": stmt.excluded.status,
+                        "updated_at": func.now(),
+                    },
+                )
             )
-            game_record = result.scalar_one_or_none()
 
-            if game_record:
-                return self._game_record_to_model(game_record)
-            return None
+            logger.debug("Saved games", count=len(games))
 
         except Exception as e:
-            logger.error("Failed to get game", game_id=game_id, error=str(e))
+            logger.error("Failed to save games", count=len(games), error=str(e))
             raise
 
     async def get_current_games(self, within_hours: int = 2) -> list[Game]:
@@ -100,7 +142,7 @@ class Repository:
                     and_(
                         GameRecord.date >= cutoff_time,
                         GameRecord.date <= now,
-                        GameRecord.status.in_(["scheduled", "live"])
+                        GameRecord.status.in_([GameStatus.SCHEDULED, GameStatus.LIVE])
                     )
                 )
                 .order_by(GameRecord.date.desc())
@@ -124,8 +166,8 @@ class Repository:
                 .where(
                     and_(
                         GameRecord.date > datetime.now(UTC),
-                        ~GameRecord.notification_sent,
-                        GameRecord.status == "scheduled"
+                        GameRecord.notification_sent == False,  # noqa: E712
+                        GameRecord.status == GameStatus.SCHEDULED
                     )
                 )
                 .order_by(GameRecord.date)
@@ -142,6 +184,27 @@ class Repository:
             logger.error("Failed to get upcoming games", error=str(e))
             raise
 
+    async def get_unnotified_games_between(self, start: datetime, end: datetime) -> list[Game]:
+        """Get games starting in [start, end] whose pre-game notification wasn't sent."""
+        try:
+            result = await self.session.execute(
+                select(GameRecord)
+                .where(
+                    and_(
+                        GameRecord.date >= start,
+                        GameRecord.date <= end,
+                        GameRecord.notification_sent == False,  # noqa: E712
+                    )
+                )
+                .order_by(GameRecord.date)
+            )
+
+            return [self._game_record_to_model(record) for record in result.scalars()]
+
+        except Exception as e:
+            logger.error("Failed to get unnotified games", error=str(e))
+            raise
+
     async def get_games_needing_final_score(self) -> list[Game]:
         """Get games notified in the last 12 hours that haven't had a final score sent."""
         try:
@@ -200,47 +263,46 @@ class Repository:
             raise
 
     # Notification job operations
-    async def save_notification_job(self, job: NotificationJob) -> None:
-        """Save or update a notification job."""
-        try:
-            job_id = job.job_id
+    async def save_notification_jobs(self, jobs: list[NotificationJob]) -> None:
+        """Save or update several notification jobs with a single lookup query."""
+        if not jobs:
+            return
 
-            # Check if job already exists
+        try:
             result = await self.session.execute(
-                select(NotificationJobRecord).where(NotificationJobRecord.id == job_id)
-            )
-            existing_job = result.scalar_one_or_none()
-
-            if existing_job:
-                # Update existing job
-                existing_job.scheduled_time = job.scheduled_time  # type: ignore[assignment]
-                existing_job.message = job.message  # type: ignore[assignment]
-                existing_job.status = job.status.value  # type: ignore[assignment]
-                existing_job.chat_id = job.chat_id  # type: ignore[assignment]
-                existing_job.attempts = job.attempts  # type: ignore[assignment]
-                existing_job.error_message = job.error_message  # type: ignore[assignment]
-                existing_job.sent_at = job.sent_at  # type: ignore[assignment]
-
-                logger.debug("Updated existing notification job", job_id=job_id)
-            else:
-                # Create new job record
-                job_record = NotificationJobRecord(
-                    id=job_id,
-                    game_id=job.game_id,
-                    scheduled_time=job.scheduled_time,
-                    message=job.message,
-                    status=job.status.value,
-                    chat_id=job.chat_id,
-                    attempts=job.attempts,
-                    error_message=job.error_message,
-                    sent_at=job.sent_at,
+                select(NotificationJobRecord).where(
+                    NotificationJobRecord.id.in_([job.job_id for job in jobs])
                 )
-
-                self.session.add(job_record)
-                logger.debug("Created new notification job", job_id=job_id)
+            )
+            existing_jobs = {record.id: record for record in result.scalars()}
+
+            for job in jobs:
+                existing_job = existing_jobs.get(job.job_id)
+                if existing_job:
+                    existing_job.scheduled_time = job.scheduled_time
+                    existing_job.message = job.message
+                    existing_job.status = job.status
+                    existing_job.chat_id = job.chat_id
+                    existing_job.attempts = job.attempts
+                    existing_job.error_message = job.error_message
+                    existing_job.sent_at = job.sent_at
+                else:
+                    self.session.add(NotificationJobRecord(
+                        id=job.job_id,
+                        game_id=job.game_id,
+                        scheduled_time=job.scheduled_time,
+                        message=job.message,
+                        status=job.status,
+                        chat_id=job.chat_id,
+                        attempts=job.attempts,
+                        error_message=job.error_message,
+                        sent_at=job.sent_at,
+                    ))
+
+            logger.debug("Saved notification jobs", count=len(jobs))
 
         except Exception as e:
-            logger.error("Failed to save notification job", job_id=job.job_id, error=str(e))
+            logger.error("Failed to save notification jobs", count=len(jobs), error=str(e))
             raise
 
     async def get_pending_jobs(self) -> list[NotificationJob]:
@@ -248,7 +310,7 @@ class Repository:
         try:
             result = await self.session.execute(
                 select(NotificationJobRecord)
-                .where(NotificationJobRecord.status == "pending")
+                .where(NotificationJobRecord.status == NotificationStatus.PENDING)
                 .order_by(NotificationJobRecord.scheduled_time)
             )
 
@@ -263,173 +325,186 @@ class Repository:
             raise
 
     # User operations
-    async def save_user(self, user: User) -> None:
-        """Save or update a user record."""
+    async def get_subscription_status(self, chat_id: int) -> bool | None:
+        """Get a user's subscribed flag, or None if the user doesn't exist."""
         try:
-            # Check if user already exists
-            result = await self.session.execute(
-                select(UserRecord).where(UserRecord.chat_id == user.chat_id)
-            )
-            existing_user = result.scalar_one_or_none()
+            result = await self.session.execute(_GET_SUBSCRIPTION_STMT, {"chat_id": chat_id})
+            subscribed: bool | None = result.scalar_one_or_none()
+            return subscribed
 
-            if existing_user:
-                # Update existing user
-                existing_user.username = user.username  # type: ignore[assignment]
-                existing_user.first_name = user.first_name  # type: ignore[assignment]
-                existing_user.last_name = user.last_name  # type: ignore[assignment]
-                existing_user.subscribed = user.subscribed  # type: ignore[assignment]
-                existing_user.timezone = user.timezone  # type: ignore[assignment]
-                existing_user.last_seen = user.last_seen  # type: ignore[assignment]
+        except Exception as e:
+            logger.error("Failed to get subscription status", chat_id=chat_id, error=str(e))
+            raise
 
-                logger.debug("Updated existing user", chat_id=user.chat_id)
-            else:
-                # Create new user record
-                user_record = UserRecord(
-                    chat_id=user.chat_id,
-                    username=user.username,
-                    first_name=user.first_name,
-                    last_name=user.last_name,
-                    subscribed=user.subscribed,
-                    timezone=user.timezone,
-                    last_seen=user.last_seen,
-                )
+    async def upsert_user_profile(
+        self,
+        chat_id: int,
+        username: str | None,
+        first_name: str | None,
+        last_name: str | None,
+        subscribed: bool | None = None,
+    ) -> None:
+        """Create or update a user's profile in a single statement.
 
-                self.session.add(user_record)
-                logger.debug("Created new user", chat_id=user.chat_id)
+        Existing profile fields are kept when Telegram sends none, and the
+        subscription flag is only changed when ``subscribed`` is given.
+        """
+        try:
+            values: dict[str, object] = {
+                "chat_id": chat_id,
+                "username": username,
+                "first_name": first_name,
+                "last_name": last_name,
+            }
+            if subscribed is not None:
+                values["subscribed"] = subscribed
+
+            stmt = sqlite_insert(UserRecord).values(**values)
+
+            set_: dict[str, object] = {
+                "username": func.coalesce(stmt.excluded.username, UserRecord.username),
+                "first_name": func.coalesce(stmt.excluded.first_name, UserRecord.first_name),
+                "last_name": func.coalesce(stmt.excluded.last_name, UserRecord.last_name),
+            }
+            if subscribed is not None:
+                set_["subscribed"] = stmt.excluded.subscribed
+
+            await self.session.execute(
+                stmt.on_conflict_do_update(index_elements=[UserRecord.chat_id], set_=set_)
+            )
+
+            logger.debug("Upserted user profile", chat_id=chat_id, subscribed=subscribed)
 
         except Exception as e:
-            logger.error("Failed to save user", chat_id=user.chat_id, error=str(e))
+            logger.error("Failed to upsert user profile", chat_id=chat_id, error=str(e))
             raise
 
-    async def get_subscribed_users(self) -> list[User]:
-        """Get all subscribed users."""
+    async def iter_subscribed_chat_ids(self, batch_size: int = 500) -> AsyncIterator[int]:
+        """Stream subscribed chat IDs in batches without hydrating user rows."""
         try:
-            result = await self.session.execute(
-                select(UserRecord).where(UserRecord.subscribed)
+            result = await self.session.stream_scalars(
+                select(UserRecord.chat_id)
+                .where(UserRecord.subscribed == True)  # noqa: E712
+                .execution_options(yield_per=batch_size)
             )
 
-            users = []
-            for record in result.scalars():
-                users.append(self._user_record_to_model(record))
+            async for chat_id in result:
+                yield chat_id
 
-            return users
+        except Exception as e:
+            logger.error("Failed to stream subscribed chat IDs", error=str(e))
+            raise
+
+    async def bulk_update_last_seen(self, last_seen: dict[int, datetime]) -> None:
+        """Update last_seen for many existing users in a single statement."""
+        if not last_seen:
+            return
+
+        try:
+            await self.session.execute(
+                update(UserRecord)
+                .where(UserRecord.chat_id.in_(last_seen))
+                .values(last_seen=case(last_seen, value=UserRecord.chat_id))
+            )
+
+            logger.debug("Updated user last seen", count=len(last_seen))
 
         except Exception as e:
-            logger.error("Failed to get subscribed users", error=str(e))
+            logger.error("Failed to bulk update last seen", count=len(last_seen), error=str(e))
             raise
 
     # Conversion methods
     def _game_record_to_model(self, record: GameRecord) -> Game:
         """Convert a GameRecord to a Game model."""
-        from ..models import GameStatus
-
-        return Game(
-            game_id=record.game_id,  # type: ignore[arg-type]
-            date=record.date,  # type: ignore[arg-type]
-            home_team=record.home_team,  # type: ignore[arg-type]
-            away_team=record.away_team,  # type: ignore[arg-type]
-            venue=record.venue or "",  # type: ignore[arg-type]
-            status=GameStatus(record.status),
-            notification_sent=record.notification_sent,  # type: ignore[arg-type]
-            final_score_sent=record.final_score_sent or False,  # type: ignore[arg-type]
-            created_at=record.created_at,  # type: ignore[arg-type]
-            updated_at=record.updated_at,  # type: ignore[arg-type]
+        return Game.model_construct(
+            game_id=record.game_id,
+            date=record.date,
+            home_team=record.home_team,
+            away_team=record.away_team,
+            venue=record.venue or "",
+            status=record.status,
+            notification_sent=record.notification_sent,
+            final_score_sent=record.final_score_sent or False,
+            created_at=record.created_at,
+            updated_at=record.updated_at,
         )
 
     def _job_record_to_model(self, record: NotificationJobRecord) -> NotificationJob:
         """Convert a NotificationJobRecord to a NotificationJob model."""
-        from ..models import NotificationStatus
-
-        return NotificationJob(
-            id=record.id,  # type: ignore[arg-type]
-            game_id=record.game_id,  # type: ignore[arg-type]
-            scheduled_time=record.scheduled_time,  # type: ignore[arg-type]
-            message=record.message,  # type: ignore[arg-type]
-            status=NotificationStatus(record.status),
-            chat_id=record.chat_id,  # type: ignore[arg-type]
-            attempts=record.attempts,  # type: ignore[arg-type]
-            error_message=record.error_message,  # type: ignore[arg-type]
-            created_at=record.created_at,  # type: ignore[arg-type]
-            sent_at=record.sent_at,  # type: ignore[arg-type]
-        )
-
-    def _user_record_to_model(self, record: UserRecord) -> User:
-        """Convert a UserRecord to a User model."""
-        return User(
-            chat_id=record.chat_id,  # type: ignore[arg-type]
-            username=record.username,  # type: ignore[arg-type]
-            first_name=record.first_name,  # type: ignore[arg-type]
-            last_name=record.last_name,  # type: ignore[arg-type]
-            subscribed=record.subscribed,  # type: ignore[arg-type]
-            timezone=record.timezone,  # type: ignore[arg-type]
-            created_at=record.created_at,  # type: ignore[arg-type]
-            last_seen=record.last_seen,  # type: ignore[arg-type]
+        return NotificationJob.model_construct(
+            id=record.id,
+            game_id=record.game_id,
+            scheduled_time=record.scheduled_time,
+            message=record.message,
+            status=record.status,
+            chat_id=record.chat_id,
+            attempts=record.attempts,
+            error_message=record.error_message,
+            created_at=record.created_at,
+            sent_at=record.sent_at,
         )
 
     # Transaction operations
-    async def transaction_exists(self, transaction_id: int) -> bool:
-        """Check if a transaction exists in the database."""
+    async def get_existing_transaction_ids(self, transaction_ids: list[int]) -> set[int]:
+        """Return which of the given transaction IDs are already stored."""
+        if not transaction_ids:
+            return set()
+
         try:
             result = await self.session.execute(
-                select(TransactionRecord).where(TransactionRecord.transaction_id == transaction_id)
+                select(TransactionRecord.transaction_id).where(
+                    TransactionRecord.transaction_id.in_(transaction_ids)
+                )
             )
-            return result.scalar_one_or_none() is not None
+            return set(result.scalars())
         except Exception as e:
-            logger.error("Failed to check transaction existence", transaction_id=transaction_id, error=str(e))
+            logger.error("Failed to check existing transactions", count=len(transaction_ids), error=str(e))
             raise
 
-    async def save_transaction(self, transaction: Transaction) -> None:
-        """Save or update a transaction record."""
+    async def save_transactions(self, transactions: list[Transaction]) -> None:
+        """Insert or update several transactions with a single upsert statement."""
+        if not transactions:
+            return
+
         try:
-            # Check if transaction already exists
-            result = await self.session.execute(
-                select(TransactionRecord).where(TransactionRecord.transaction_id == transaction.transaction_id)
-            )
-            existing_transaction = result.scalar_one_or_none()
-
-            if existing_transaction:
-                # Update existing transaction
-                existing_transaction.person_id = transaction.person_id  # type: ignore[assignment]
-                existing_transaction.person_name = transaction.person_name  # type: ignore[assignment]
-                existing_transaction.from_team_id = transaction.from_team_id  # type: ignore[assignment]
-                existing_transaction.from_team_name = transaction.from_team_name  # type: ignore[assignment]
-                existing_transaction.to_team_id = transaction.to_team_id  # type: ignore[assignment]
-                existing_transaction.to_team_name = transaction.to_team_name  # type: ignore[assignment]
-                existing_transaction.transaction_date = transaction.transaction_date  # type: ignore[assignment]
-                existing_transaction.effective_date = transaction.effective_date  # type: ignore[assignment]
-                existing_transaction.resolution_date = transaction.resolution_date  # type: ignore[assignment]
-                existing_transaction.type_code = transaction.type_code  # type: ignore[assignment]
-                existing_transaction.type_description = transaction.type_description  # type: ignore[assignment]
-                existing_transaction.description = transaction.description  # type: ignore[assignment]
-
-                logger.debug("Updated existing transaction", transaction_id=transaction.transaction_id)
-            else:
-                # Create new transaction record
-                transaction_record = TransactionRecord(
-                    transaction_id=transaction.transaction_id,
-                    person_id=transaction.person_id,
-                    person_name=transaction.person_name,
-                    from_team_id=transaction.from_team_id,
-                    from_team_name=transaction.from_team_name,
-                    to_team_id=transaction.to_team_id,
-                    to_team_name=transaction.to_team_name,
-                    transaction_date=transaction.transaction_date,
-                    effective_date=transaction.effective_date,
-                    resolution_date=transaction.resolution_date,
-                    type_code=transaction.type_code,
-                    type_description=transaction.type_description,
-                    description=transaction.description,
-                    notification_sent=False
+            stmt = sqlite_insert(TransactionRecord).values([
+                {
+                    "transaction_id": transaction.transaction_id,
+                    "person_id": transaction.person_id,
+                    "person_name": transaction.person_name,
+                    "from_team_id": transaction.from_team_id,
+                    "from_team_name": transaction.from_team_name,
+                    "to_team_id": transaction.to_team_id,
+                    "to_team_name": transaction.to_team_name,
+                    "transaction_date": transaction.transaction_date,
+                    "effective_date": transaction.effective_date,
+                    "resolution_date": transaction.resolution_date,
+                    "type_code": transaction.type_code,
+                    "type_description": transaction.type_description,
+                    "description": transaction.description,
+                    "notification_sent": False,
+                }
+                for transaction in transactions
+            ])
+            # notification_sent is local state — never overwrite
+            await self.session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[TransactionRecord.transaction_id],
+                    set_={
+                        column: stmt.excluded[column]
+                        for column in (
+                            "person_id", "person_name", "from_team_id", "from_team_name",
+                            "to_team_id", "to_team_name", "transaction_date", "effective_date",
+                            "resolution_date", "type_code", "type_description", "description",
+                        )
+                    },
                 )
+            )
 
-                self.session.add(transaction_record)
-                logger.debug("Created new transaction", transaction_id=transaction.transaction_id)
-
-            await self.session.commit()
+            logger.debug("Saved transactions", count=len(transactions))
 
         except Exception as e:
-            await self.session.rollback()
-            logger.error("Failed to save transaction", transaction_id=transaction.transaction_id, error=str(e))
+            logger.error("Failed to save transactions", count=len(transactions), error=str(e))
             raise
 
     async def get_new_transactions(self) -> list[Transaction]:
@@ -476,47 +551,24 @@ class Repository:
 
     # User transaction preferences operations
     async def save_user_transaction_preferences(self, preferences: UserTransactionPreferences) -> None:
-        """Save or update user transaction preferences."""
+        """Save or update user transaction preferences in a single statement."""
         try:
-            # Check if preferences already exist
-            result = await self.session.execute(
-                select(UserTransactionPreference).where(UserTransactionPreference.chat_id == preferences.chat_id)
-            )
-            existing_preferences = result.scalar_one_or_none()
-
-            if existing_preferences:
-                # Update existing preferences
-                existing_preferences.trades = preferences.trades  # type: ignore[assignment]
-                existing_preferences.signings = preferences.signings  # type: ignore[assignment]
-                existing_preferences.recalls = preferences.recalls  # type: ignore[assignment]
-                existing_preferences.options = preferences.options  # type: ignore[assignment]
-                existing_preferences.injuries = preferences.injuries  # type: ignore[assignment]
-                existing_preferences.activations = preferences.activations  # type: ignore[assignment]
-                existing_preferences.releases = preferences.releases  # type: ignore[assignment]
-                existing_preferences.status_changes = preferences.status_changes  # type: ignore[assignment]
-                existing_preferences.other = preferences.other  # type: ignore[assignment]
-                existing_preferences.major_league_only = preferences.major_league_only  # type: ignore[assignment]
-                existing_preferences.updated_at = datetime.now(UTC)  # type: ignore[assignment]
-
-                logger.debug("Updated user transaction preferences", chat_id=preferences.chat_id)
-            else:
-                # Create new preferences record
-                preferences_record = UserTransactionPreference(
-                    chat_id=preferences.chat_id,
-                    trades=preferences.trades,
-                    signings=preferences.signings,
-                    recalls=preferences.recalls,
-                    options=preferences.options,
-                    injuries=preferences.injuries,
-                    activations=preferences.activations,
-                    releases=preferences.releases,
-                    status_changes=preferences.status_changes,
-                    other=preferences.other,
-                    major_league_only=preferences.major_league_only
+            stmt = sqlite_insert(UserTransactionPreference).values(
+                chat_id=preferences.chat_id,
+                preferences_mask=_preferences_mask(preferences),
+                major_league_only=preferences.major_league_only,
+            )
+            await self.session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[UserTransactionPreference.chat_id],
+                    set_={
+                        "preferences_mask": stmt.excluded.preferences_mask,
+                        "major_league_only": stmt.excluded.major_league_only,
+                        "updated_at": func.now(),
+                    },
                 )
-
-                self.session.add(preferences_record)
-                logger.debug("Created new user transaction preferences", chat_id=preferences.chat_id)
+            )
+            logger.debug("Saved user transaction preferences", chat_id=preferences.chat_id)
 
             await self.session.commit()
 
@@ -525,11 +577,56 @@ class Repository:
             logger.error("Failed to save user transaction preferences", chat_id=preferences.chat_id, error=str(e))
             raise
 
+    async def toggle_user_transaction_preference(
+        self, chat_id: int, preference_name: str
+    ) -> UserTransactionPreferences:
+        """Flip one transaction preference in a single statement and return the result.
+
+        The flip happens in SQL against the stored row, so concurrent toggles
+        from the same chat each apply rather than overwriting one another.
+        Users without saved preferences start from the defaults.
+        """
+        try:
+            if preference_name == "major_league_only":
+                values: dict[str, Any] = {"major_league_only": False}
+                set_: dict[str, Any] = {
+                    "major_league_only": not_(func.coalesce(UserTransactionPreference.major_league_only, True))
+                }
+            else:
+                flag = int(TransactionPreferenceFlag[preference_name.upper()])
+                mask = UserTransactionPreference.preferences_mask
+                values = {"preferences_mask": DEFAULT_TRANSACTION_PREFERENCES ^ flag}
+                # SQLite has no XOR operator; (a | b) - (a & b) is equivalent
+                set_ = {"preferences_mask": mask.op("|")(flag) - mask.op("&")(flag)}
+
+            stmt = sqlite_insert(UserTransactionPreference).values(chat_id=chat_id, **values)
+            record = await self.session.scalar(
+                stmt.on_conflict_do_update(
+                    index_elements=[UserTransactionPreference.chat_id],
+                    set_={**set_, "updated_at": func.now()},
+                ).returning(UserTransactionPreference)
+            )
+            if record is None:
+                raise RuntimeError("Preference upsert returned no row")
+            preferences = self._user_preferences_record_to_model(record)
+
+            await self.session.commit()
+            logger.debug("Toggled user transaction preference", chat_id=chat_id, preference=preference_name)
+            return preferences
+
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(
+                "Failed to toggle user transaction preference",
+                chat_id=chat_id, preference=preference_name, error=str(e),
+            )
+            raise
+
     async def get_user_transaction_preferences(self, chat_id: int) -> UserTransactionPreferences:
         """Get user transaction preferences."""
         try:
             result = await self.session.execute(
-                select(UserTransactionPreference).where(UserTransactionPreference.chat_id == chat_id)
+                _GET_TRANSACTION_PREFERENCES_STMT, {"chat_id": chat_id}
             )
             preferences_record = result.scalar_one_or_none()
 
@@ -544,68 +641,67 @@ class Repository:
             # Return default preferences on error
             return UserTransactionPreferences(chat_id=chat_id)
 
-    async def get_users_for_transaction_notification(self, transaction: Transaction) -> list[tuple[User, UserTransactionPreferences]]:
-        """Get users who should be notified about a specific transaction."""
+    async def get_transaction_recipient_ids(self, transaction: Transaction) -> list[int]:
+        """Get chat IDs of subscribed users who want a notification for this transaction.
+
+        Type preferences and the major-league-only filter are both applied in
+        one query, so no user or preference models are built.
+        """
         try:
-            # Get all subscribed users with their preferences
+            conditions = [
+                UserRecord.subscribed == True,  # noqa: E712
+                _wants_transaction_type(transaction),
+            ]
+            if is_minor_league_transaction(transaction.description):
+                conditions.append(
+                    func.coalesce(UserTransactionPreference.major_league_only, True) == False  # noqa: E712
+                )
+
             result = await self.session.execute(
-                select(UserRecord, UserTransactionPreference)
+                select(UserRecord.chat_id)
                 .outerjoin(UserTransactionPreference, UserRecord.chat_id == UserTransactionPreference.chat_id)
-                .where(UserRecord.subscribed == True)  # noqa: E712
+                .where(*conditions)
             )
-
-            user_preferences = []
-            for user_record, pref_record in result.all():
-                user = self._user_record_to_model(user_record)
-
-                if pref_record:
-                    preferences = self._user_preferences_record_to_model(pref_record)
-                else:
-                    # Use default preferences if none exist
-                    preferences = UserTransactionPreferences(chat_id=user.chat_id)
-
-                # Check if user should be notified for this transaction
-                if preferences.should_notify_for_transaction(transaction.transaction_type, transaction.description):
-                    user_preferences.append((user, preferences))
-
-            return user_preferences
+            return list(result.scalars())
 
         except Exception as e:
-            logger.error("Failed to get users for transaction notification", error=str(e))
+            logger.error(
+                "Failed to get transaction recipients", transaction_id=transaction.transaction_id, error=str(e)
+            )
             return []
 
     def _transaction_record_to_model(self, record: TransactionRecord) -> Transaction:
         """Convert a TransactionRecord to a Transaction model."""
-        return Transaction(
-            transaction_id=record.transaction_id,  # type: ignore[arg-type]
-            person_id=record.person_id,  # type: ignore[arg-type]
-            person_name=record.person_name,  # type: ignore[arg-type]
-            from_team_id=record.from_team_id,  # type: ignore[arg-type]
-            from_team_name=record.from_team_name,  # type: ignore[arg-type]
-            to_team_id=record.to_team_id,  # type: ignore[arg-type]
-            to_team_name=record.to_team_name,  # type: ignore[arg-type]
-            transaction_date=record.transaction_date,  # type: ignore[arg-type]
-            effective_date=record.effective_date,  # type: ignore[arg-type]
-            resolution_date=record.resolution_date,  # type: ignore[arg-type]
-            type_code=record.type_code,  # type: ignore[arg-type]
-            type_description=record.type_description,  # type: ignore[arg-type]
-            description=record.description,  # type: ignore[arg-type]
+        return Transaction.model_construct(
+            transaction_id=record.transaction_id,
+            person_id=record.person_id,
+            person_name=record.person_name,
+            from_team_id=record.from_team_id,
+            from_team_name=record.from_team_name,
+            to_team_id=record.to_team_id,
+            to_team_name=record.to_team_name,
+            transaction_date=record.transaction_date.date(),
+            effective_date=_as_date(record.effective_date),
+            resolution_date=_as_date(record.resolution_date),
+            type_code=record.type_code,
+            type_description=record.type_description,
+            description=record.description,
         )
 
     def _user_preferences_record_to_model(self, record: UserTransactionPreference) -> UserTransactionPreferences:
         """Convert a UserTransactionPreference to a UserTransactionPreferences model."""
-        return UserTransactionPreferences(
-            chat_id=record.chat_id,  # type: ignore[arg-type]
-            trades=record.trades,  # type: ignore[arg-type]
-            signings=record.signings,  # type: ignore[arg-type]
-            recalls=record.recalls,  # type: ignore[arg-type]
-            options=record.options,  # type: ignore[arg-type]
-            injuries=record.injuries,  # type: ignore[arg-type]
-            activations=record.activations,  # type: ignore[arg-type]
-            releases=record.releases,  # type: ignore[arg-type]
-            status_changes=record.status_changes,  # type: ignore[arg-type]
-            other=record.other,  # type: ignore[arg-type]
-            major_league_only=record.major_league_only,  # type: ignore[arg-type]
+        return UserTransactionPreferences.model_construct(
+            chat_id=record.chat_id,
+            trades=record.trades,
+            signings=record.signings,
+            recalls=record.recalls,
+            options=record.options,
+            injuries=record.injuries,
+            activations=record.activations,
+            releases=record.releases,
+            status_changes=record.status_changes,
+            other=record.other,
+            major_league_only=record.major_league_only,
         )
 
     # Play-by-play session operations
@@ -2,18 +2,70 @@
 
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
 
 import structlog
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, event, make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import ConnectionPoolEntry
 
 from ..config import Settings
+from . import activity
 from .models import Base
 
 logger = structlog.get_logger(__name__)
 
 
+def get_async_database_url(database_url: str) -> str:
+    """Return the async-driver form of a database URL."""
+    if database_url.startswith("sqlite"):
+        # Convert sqlite URL to async version
+        return database_url.replace("sqlite:///", "sqlite+aiosqlite:///")
+    # For other databases, the URL already names its async driver
+    return database_url
+
+
+def get_pool_options(database_url: str, pool_size: int, max_overflow: int) -> dict[str, int]:
+    """Return queue-pool sizing options, or none for URLs that can't take them.
+
+    In-memory SQLite databases get a StaticPool, which rejects pool_size and
+    max_overflow.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and (
+        url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+    ):
+        return {}
+    return {"pool_size": pool_size, "max_overflow": max_overflow}
+
+
+def _parse_sqlite_pragmas(pragmas_str: str) -> list[tuple[str, str]]:
+    """Parse SQLite PRAGMAs from 'name=value,name2=value2' format."""
+    pragmas: list[tuple[str, str]] = []
+    for pragma in pragmas_str.split(","):
+        name, sep, value = pragma.partition("=")
+        name, value = name.strip(), value.strip()
+        if sep and name.isidentifier() and value.replace("-", "").isalnum():
+            pragmas.append((name, value))
+        elif pragma.strip():
+            logger.warning("Ignoring invalid SQLite PRAGMA", pragma=pragma.strip())
+    return pragmas
+
+
+def _apply_sqlite_pragmas(engine: Engine, pragmas: list[tuple[str, str]]) -> None:
+    """Run the given PRAGMAs on every new connection the engine opens."""
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection: Any, _connection_record: ConnectionPoolEntry) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas:
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
 class DatabaseSession:
     """Database session manager."""
 
@@ -23,21 +75,12 @@ class DatabaseSession:
         self.database_url = settings.database_url
 
         # Create async engine for main operations
-        if self.database_url.startswith("sqlite"):
-            # Convert sqlite URL to async version
-            async_url = self.database_url.replace("sqlite:///", "sqlite+aiosqlite:///")
-            self.async_engine = create_async_engine(
-                async_url,
-                echo=settings.debug,
-                future=True,
-            )
-        else:
-            # For other databases, use asyncpg
-            self.async_engine = create_async_engine(
-                self.database_url,
-                echo=settings.debug,
-                future=True,
-            )
+        self.async_engine = create_async_engine(
+            get_async_database_url(self.database_url),
+            echo=settings.debug,
+            future=True,
+            **get_pool_options(self.database_url, pool_size=10, max_overflow=20),
+        )
 
         # Create sync engine for migrations
         self.sync_engine = create_engine(
@@ -46,6 +89,13 @@ class DatabaseSession:
             future=True,
         )
 
+        # WAL lets the notification polling read while a sync is writing, and
+        # synchronous=NORMAL fsyncs at checkpoints rather than on every commit
+        if self.database_url.startswith("sqlite"):
+            pragmas = _parse_sqlite_pragmas(settings.sqlite_pragmas)
+            _apply_sqlite_pragmas(self.async_engine.sync_engine, pragmas)
+            _apply_sqlite_pragmas(self.sync_engine, pragmas)
+
         # Session factories
         self.async_session_factory = async_sessionmaker(
             self.async_engine,
@@ -91,12 +141,25 @@ class DatabaseSession:
             try:
                 yield session
                 await session.commit()
+                activity.touch()
             except Exception:
                 await session.rollback()
                 raise
             finally:
                 await session.close()
 
+    @asynccontextmanager
+    async def read_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Get an async session for SELECT-only work.
+
+        The connection runs in autocommit mode, so no transaction is begun,
+        committed or rolled back around the reads.
+        """
+        async with self.async_session_factory() as session:
+            await session.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+            yield session
+            activity.touch()
+
     async def close(self) -> None:
         """Close database connections."""
         logger.info("Closing database connections")
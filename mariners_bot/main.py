@@ -246,14 +246,10 @@ class MarinersBot:
                 return
 
             # Save games to database
-            saved_count = 0
+            mariners_games = [game for game in all_games if game.is_mariners_game]
+            saved_count = len(mariners_games)
             async with self.db_session.get_session() as session:
-                repository = Repository(session)
-
-                for game in all_games:
-                    if game.is_mariners_game:
-                        await repository.save_game(game)
-                        saved_count += 1
+                await Repository(session).save_games(mariners_games)
 
             logger.info("Saved games to database", count=saved_count)
 
@@ -302,37 +298,17 @@ class MarinersBot:
             now = datetime.now(UTC)
             cutoff = now - timedelta(hours=window_hours)
 
-            async with self.db_session.get_session() as session:
-                from sqlalchemy import and_, select
-
-                from .database.models import GameRecord
-
-                result = await session.execute(
-                    select(GameRecord).where(
-                        and_(
-                            GameRecord.date >= cutoff,
-                            GameRecord.date <= now,
-                            GameRecord.notification_sent == False,  # noqa: E712
-                        )
-                    ).order_by(GameRecord.date)
-                )
-                records = result.scalars().all()
+            # Load every missed game in one session rather than one per game
+            async with self.db_session.read_session() as session:
+                games = await Repository(session).get_unnotified_games_between(cutoff, now)
 
-            if not records:
+            if not games:
                 logger.info("No missed pre-game notifications to send")
                 return
 
-            logger.info("Found missed pre-game notifications", count=len(records))
-
-            from .database.repository import Repository
-
-            for record in records:
-                async with self.db_session.get_session() as session:
-                    game = await Repository(session).get_game(str(record.game_id))
-
-                if game is None:
-                    continue
+            logger.info("Found missed pre-game notifications", count=len(games))
 
+            for game in games:
                 message = await self.scheduler._create_notification_message(game)
                 job = NotificationJob(
                     game_id=game.game_id,
@@ -369,18 +345,14 @@ class MarinersBot:
                 return
 
             # Save transactions to database and identify new ones
-            new_transactions = []
+            mariners_transactions = [t for t in transactions if t.is_mariners_transaction]
             async with self.db_session.get_session() as session:
                 repository = Repository(session)
 
-                for transaction in transactions:
-                    if transaction.is_mariners_transaction:
-                        # Check if this is a new transaction
-                        existing = await self._is_transaction_existing(repository, transaction.transaction_id)
-                        if not existing:
-                            new_transactions.append(transaction)
+                existing_ids = await self._get_existing_transaction_ids(repository, mariners_transactions)
+                new_transactions = [t for t in mariners_transactions if t.transaction_id not in existing_ids]
 
-                        await repository.save_transaction(transaction)
+                await repository.save_transactions(mariners_transactions)
 
             if new_transactions:
                 logger.info("Found new transactions", count=len(new_transactions))
@@ -433,14 +405,16 @@ class MarinersBot:
                         # Send to all subscribed users
                         async with self.db_session.get_session() as session:
                             repository = Repository(session)
-                            users = await repository.get_subscribed_users()
+                            chat_ids = [
+                                chat_id async for chat_id in repository.iter_subscribed_chat_ids()
+                            ]
                             await repository.mark_game_final_score_sent(game.game_id)
                             await session.commit()
 
-                        for user in users:
-                            if str(user.chat_id) != self.settings.telegram_chat_id:
+                        for chat_id in chat_ids:
+                            if str(chat_id) != self.settings.telegram_chat_id:
                                 await self.telegram_bot._send_message_with_retry(
-                                    chat_id=str(user.chat_id),
+                                    chat_id=str(chat_id),
                                     message=message
                                 )
 
@@ -473,14 +447,16 @@ class MarinersBot:
             f"📊 <a href=\"{game.baseball_savant_url}\">Full Game on Baseball Savant</a>"
         )
 
-    async def _is_transaction_existing(self, repository: Repository, transaction_id: int) -> bool:
-        """Check if a transaction already exists in the database."""
+    async def _get_existing_transaction_ids(
+        self, repository: Repository, transactions: list[Transaction]
+    ) -> set[int]:
+        """Get the IDs of transactions already in the database."""
         try:
-            # Check if transaction exists in database (regardless of notification status)
-            return await repository.transaction_exists(transaction_id)
+            # Regardless of notification status
+            return await repository.get_existing_transaction_ids([t.transaction_id for t in transactions])
         except Exception:
-            # If we can't check, assume it's new to be safe
-            return False
+            # If we can't check, assume they're all new to be safe
+            return set()
 
     async def _process_new_transactions(self, transactions: list[Transaction]) -> None:
         """Process new transactions and send notifications."""
@@ -494,10 +470,8 @@ class MarinersBot:
 
                 # Process individual user notifications with batching
                 for transaction in transactions:
-                    users_preferences = await repository.get_users_for_transaction_notification(transaction)
-
-                    for user, _preferences in users_preferences:
-                        await self._handle_user_transaction_notification(user.chat_id, transaction, repository)
+                    for chat_id in await repository.get_transaction_recipient_ids(transaction):
+                        await self._handle_user_transaction_notification(chat_id, transaction, repository)
 
         except Exception as e:
             logger.error("Failed to process new transactions", error=str(e))
@@ -4,6 +4,33 @@ from pydantic import BaseModel, Field
 
 from .transaction import TransactionType
 
+# Preference field that controls each transaction type
+TRANSACTION_TYPE_PREFERENCES: dict[TransactionType, str] = {
+    TransactionType.TRADE: "trades",
+    TransactionType.SIGNED_FREE_AGENT: "signings",
+    TransactionType.RECALLED: "recalls",
+    TransactionType.OPTIONED: "options",
+    TransactionType.INJURED_LIST: "injuries",
+    TransactionType.ACTIVATED: "activations",
+    TransactionType.RELEASED: "releases",
+    TransactionType.STATUS_CHANGE: "status_changes",
+    TransactionType.SELECTED: "recalls",  # Similar to recalls
+    TransactionType.DESIGNATED: "status_changes",  # General status change
+    TransactionType.SUSPENDED: "status_changes",
+    TransactionType.PURCHASED: "signings",  # Similar to signings
+    TransactionType.CLAIMED: "signings",  # Similar to signings
+    TransactionType.REINSTATED: "activations",  # Similar to activations
+    TransactionType.OTHER: "other",
+}
+
+_MINOR_LEAGUE_TERMS = ("minor league", "triple-a", "double-a", "single-a", "rookie")
+
+
+def is_minor_league_transaction(description: str) -> bool:
+    """Check whether a transaction description refers to a minor league move."""
+    description_lower = description.lower()
+    return any(term in description_lower for term in _MINOR_LEAGUE_TERMS)
+
 
 class UserTransactionPreferences(BaseModel):
     """User preferences for transaction notifications."""
@@ -27,31 +54,10 @@ class UserTransactionPreferences(BaseModel):
     def should_notify_for_transaction(self, transaction_type: TransactionType, description: str) -> bool:
         """Check if user should be notified for this transaction type."""
         # Check if it's a minor league transaction and user only wants major league
-        if self.major_league_only:
-            description_lower = description.lower()
-            if any(term in description_lower for term in ["minor league", "triple-a", "double-a", "single-a", "rookie"]):
-                return False
-
-        # Map transaction types to preferences
-        type_preferences = {
-            TransactionType.TRADE: self.trades,
-            TransactionType.SIGNED_FREE_AGENT: self.signings,
-            TransactionType.RECALLED: self.recalls,
-            TransactionType.OPTIONED: self.options,
-            TransactionType.INJURED_LIST: self.injuries,
-            TransactionType.ACTIVATED: self.activations,
-            TransactionType.RELEASED: self.releases,
-            TransactionType.STATUS_CHANGE: self.status_changes,
-            TransactionType.SELECTED: self.recalls,  # Similar to recalls
-            TransactionType.DESIGNATED: self.status_changes,  # General status change
-            TransactionType.SUSPENDED: self.status_changes,
-            TransactionType.PURCHASED: self.signings,  # Similar to signings
-            TransactionType.CLAIMED: self.signings,  # Similar to signings
-            TransactionType.REINSTATED: self.activations,  # Similar to activations
-            TransactionType.OTHER: self.other,
-        }
-
-        return type_preferences.get(transaction_type, self.other)
+        if self.major_league_only and is_minor_league_transaction(description):
+            return False
+
+        return bool(getattr(self, TRANSACTION_TYPE_PREFERENCES.get(transaction_type, "other")))
 
     @property
     def summary(self) -> str:
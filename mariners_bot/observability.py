@@ -16,6 +16,7 @@ from opentelemetry.sdk.trace.export import (
     ConsoleSpanExporter,
     SimpleSpanProcessor,
 )
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF, ParentBased, Sampler, TraceIdRatioBased
 
 from mariners_bot.config import Settings
 
@@ -33,7 +34,7 @@ def setup_telemetry(settings: Settings) -> None:
     })
 
     # Set up tracing
-    tracer_provider = TracerProvider(resource=resource)
+    tracer_provider = TracerProvider(resource=resource, sampler=_get_trace_sampler(settings))
     trace.set_tracer_provider(tracer_provider)
 
     # Configure trace exporters based on settings
@@ -66,6 +67,18 @@ def _parse_otlp_headers(headers_str: str) -> dict[str, str]:
     return headers
 
 
+def _get_trace_sampler(settings: Settings) -> Sampler:
+    """Choose the head sampler for new traces.
+
+    With no exporter configured, spans would be recorded and then dropped, so
+    they are not sampled at all. Otherwise root spans are kept at
+    otel_traces_sample_ratio and child spans follow their parent's decision.
+    """
+    if settings.otel_traces_exporter != "console" and not settings.otel_exporter_otlp_endpoint:
+        return ALWAYS_OFF
+    return ParentBased(TraceIdRatioBased(settings.otel_traces_sample_ratio))
+
+
 def _setup_trace_exporters(tracer_provider: TracerProvider, settings: Settings) -> None:
     """Configure trace exporters based on settings."""
 
@@ -2,8 +2,8 @@
 
 from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 
-import pytz
 import structlog
 from apscheduler.executors.asyncio import AsyncIOExecutor
 from apscheduler.jobstores.memory import MemoryJobStore
@@ -91,7 +91,7 @@ class GameScheduler:
     def __init__(self, settings: Settings) -> None:
         """Initialize the game scheduler."""
         self.settings = settings
-        self.timezone = pytz.timezone(settings.scheduler_timezone)
+        self.timezone = ZoneInfo(settings.scheduler_timezone)
 
         # Configure job store
         jobstores = {
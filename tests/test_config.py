@@ -62,9 +62,8 @@ class TestSettings:
     def test_get_settings_singleton(self) -> None:
         """Test that get_settings returns the same instance."""
         with patch.dict(os.environ, {"TELEGRAM_BOT_TOKEN": "test"}, clear=True):
-            # Reset the global settings to test singleton behavior
-            import mariners_bot.config
-            mariners_bot.config._settings = None
+            # Reset the cached settings to test singleton behavior
+            get_settings.cache_clear()
 
             settings1 = get_settings()
             settings2 = get_settings()
@@ -0,0 +1,50 @@
+"""Tests for database session setup."""
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+from mariners_bot.config import Settings
+from mariners_bot.database.session import DatabaseSession, _parse_sqlite_pragmas
+
+
+class TestDatabaseSession:
+    """Test engine configuration."""
+
+    def test_parse_sqlite_pragmas(self) -> None:
+        """Test parsing PRAGMAs and skipping malformed entries."""
+        pragmas = _parse_sqlite_pragmas("journal_mode=WAL, cache_size=-64000,bogus,x=1;DROP")
+
+        assert pragmas == [("journal_mode", "WAL"), ("cache_size", "-64000")]
+
+    @pytest.mark.asyncio
+    async def test_sqlite_pragmas_applied_on_connect(self, tmp_path: Path) -> None:
+        """Test that new SQLite connections use WAL with the configured PRAGMAs."""
+        settings = Settings(
+            telegram_bot_token="test",
+            database_url=f"sqlite:///{tmp_path / 'bot.db'}",
+            sqlite_pragmas="journal_mode=WAL,synchronous=NORMAL,busy_timeout=1234",
+        )
+        db = DatabaseSession(settings)
+
+        try:
+            async with db.async_engine.connect() as conn:
+                assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+                assert (await conn.execute(text("PRAGMA synchronous"))).scalar() == 1  # NORMAL
+                assert (await conn.execute(text("PRAGMA busy_timeout"))).scalar() == 1234
+        finally:
+            await db.close()
+
+    @pytest.mark.asyncio
+    async def test_in_memory_database_url(self) -> None:
+        """Test that an in-memory SQLite URL builds without queue-pool options."""
+        settings = Settings(telegram_bot_token="test", database_url="sqlite:///:memory:")
+        db = DatabaseSession(settings)
+
+        try:
+            await db.create_tables()
+            async with db.async_engine.connect() as conn:
+                assert (await conn.execute(text("SELECT 1"))).scalar() == 1
+        finally:
+            await db.close()
@@ -1,13 +1,15 @@
 """Tests for MLB API client."""
 
+import asyncio
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
+import aiohttp
 import pytest
 
 from mariners_bot.clients import MLBClient
 from mariners_bot.config import Settings
-from mariners_bot.models import GameStatus
+from mariners_bot.models import GameStatus, GameType
 
 
 class TestMLBClient:
@@ -63,6 +65,28 @@ class TestMLBClient:
         assert game.status == GameStatus.SCHEDULED
         assert game.is_mariners_game
 
+    def test_parse_game_data_uses_game_type_from_response(self) -> None:
+        """Test that each game's own gameType wins over the requested one."""
+        settings = Settings(telegram_bot_token="test")
+        client = MLBClient(settings)
+
+        game_data = {
+            "gamePk": 776500,
+            "gameDate": "2025-10-04T20:08:00Z",
+            "gameType": "D",
+            "teams": {
+                "home": {"team": {"name": "Seattle Mariners"}},
+                "away": {"team": {"name": "Detroit Tigers"}}
+            },
+            "venue": {"name": "T-Mobile Park"},
+            "status": {"abstractGameCode": "S"}
+        }
+
+        game = client._parse_game_data(game_data, "R")
+
+        assert game is not None
+        assert game.game_type == GameType.DIVISION_SERIES
+
     def test_parse_game_data_invalid(self) -> None:
         """Test parsing invalid game data."""
         settings = Settings(telegram_bot_token="test")
@@ -74,6 +98,22 @@ class TestMLBClient:
         game = client._parse_game_data(invalid_data)
         assert game is None
 
+    def test_parse_probable_pitchers(self) -> None:
+        """Test parsing probable pitchers when one or both are missing."""
+        settings = Settings(telegram_bot_token="test")
+        client = MLBClient(settings)
+
+        game_data = {
+            "teams": {
+                "home": {"probablePitcher": {"fullName": "Logan Gilbert"}},
+                "away": {"team": {"name": "Houston Astros"}},
+            }
+        }
+
+        assert client._parse_probable_pitchers(game_data) == {"home": "Logan Gilbert"}
+        assert client._parse_probable_pitchers({"teams": None}) is None
+        assert client._parse_probable_pitchers({}) is None
+
     def test_parse_schedule_response(self) -> None:
         """Test parsing full schedule response."""
         settings = Settings(telegram_bot_token="test")
@@ -131,3 +171,56 @@ class TestMLBClient:
 
             # Session should be closed when exiting context
             mock_session.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cached_request_reuses_response(self) -> None:
+        """Test that repeated and concurrent identical requests share one fetch."""
+        settings = Settings(telegram_bot_token="test")
+        client = MLBClient(settings)
+
+        async def slow_response(*_args: object, **_kwargs: object) -> dict[str, list[str]]:
+            await asyncio.sleep(0.01)
+            return {"dates": []}
+
+        with patch.object(client, "_make_request", AsyncMock(side_effect=slow_response)) as mock_request:
+            params = {"gamePk": "1", "hydrate": "probablePitcher"}
+            results = await asyncio.gather(
+                client._make_cached_request("schedule", params, 60),
+                client._make_cached_request("schedule", dict(reversed(params.items())), 60),
+            )
+            again = await client._make_cached_request("schedule", params, 60)
+
+            assert results[0] is results[1] is again
+            mock_request.assert_called_once()
+
+            # Different params are fetched separately
+            await client._make_cached_request("schedule", {"gamePk": "2"}, 60)
+            assert mock_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_json_retries_server_errors_only(self) -> None:
+        """Test that 5xx responses are retried and 4xx responses are not."""
+        settings = Settings(telegram_bot_token="test")
+        client = MLBClient(settings)
+
+        def response_error(status: int) -> aiohttp.ClientResponseError:
+            return aiohttp.ClientResponseError(Mock(), (), status=status)
+
+        ok_response = AsyncMock()
+        ok_response.raise_for_status = Mock()
+        ok_response.json.return_value = {"dates": []}
+
+        client.session = Mock()
+        client.session.get.return_value.__aenter__ = AsyncMock(
+            side_effect=[response_error(503), ok_response]
+        )
+        client.session.get.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        with patch("mariners_bot.clients.mlb_client.asyncio.sleep", AsyncMock()) as mock_sleep:
+            assert await client._get_json("https://example.test/schedule") == {"dates": []}
+            mock_sleep.assert_awaited_once()
+
+            client.session.get.return_value.__aenter__ = AsyncMock(side_effect=response_error(404))
+            with pytest.raises(aiohttp.ClientResponseError):
+                await client._get_json("https://example.test/schedule")
+            mock_sleep.assert_awaited_once()
@@ -0,0 +1,77 @@
+"""Tests for the outgoing message rate limiter."""
+
+import asyncio
+from time import monotonic
+
+import pytest
+
+from mariners_bot.bot.rate_limiter import AdaptiveTokenBucket, TokenBucket
+
+
+class TestTokenBucket:
+    """Test token bucket throttling."""
+
+    @pytest.mark.asyncio
+    async def test_burst_up_to_capacity_is_immediate(self) -> None:
+        """Test that a full bucket allows a burst without waiting."""
+        bucket = TokenBucket(5, period=1.0)
+
+        start = monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+
+        assert monotonic() - start < 0.05
+
+    @pytest.mark.asyncio
+    async def test_waits_for_refill_when_empty(self) -> None:
+        """Test that acquiring from an empty bucket waits for the next token."""
+        bucket = TokenBucket(10, period=1.0)
+        for _ in range(10):
+            await bucket.acquire()
+
+        start = monotonic()
+        async with bucket:
+            pass
+
+        # One token refills every 0.1s
+        assert monotonic() - start >= 0.08
+
+    @pytest.mark.asyncio
+    async def test_concurrent_waiters_are_spaced(self) -> None:
+        """Test that concurrent callers are released at the fill rate."""
+        bucket = TokenBucket(20, period=1.0)
+        for _ in range(20):
+            await bucket.acquire()
+
+        start = monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+
+        # Three tokens at 20/s take roughly 0.15s
+        assert monotonic() - start >= 0.12
+
+
+class TestAdaptiveTokenBucket:
+    """Test congestion backoff and recovery."""
+
+    def test_congestion_halves_rate_and_success_recovers(self) -> None:
+        """Test multiplicative decrease on congestion and additive increase on success."""
+        bucket = AdaptiveTokenBucket(30, period=1.0, min_rate=1.0, increase_step=5.0)
+
+        bucket.on_congestion()
+        assert bucket.fill_rate == 15
+
+        bucket.on_success()
+        assert bucket.fill_rate == 20
+
+        for _ in range(10):
+            bucket.on_success()
+        assert bucket.fill_rate == 30
+
+    def test_congestion_respects_min_rate(self) -> None:
+        """Test that repeated congestion never drops below the floor."""
+        bucket = AdaptiveTokenBucket(30, period=1.0, min_rate=2.0)
+
+        for _ in range(10):
+            bucket.on_congestion()
+
+        assert bucket.fill_rate == 2.0
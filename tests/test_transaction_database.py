@@ -7,7 +7,7 @@ import pytest
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from mariners_bot.database.models import Base
+from mariners_bot.database.models import Base, TransactionPreferenceFlag
 from mariners_bot.database.repository import Repository
 from mariners_bot.models.transaction import Transaction, TransactionType
 from mariners_bot.models.user_preferences import UserTransactionPreferences
@@ -64,11 +64,11 @@ class TestTransactionRepository:
     """Test transaction database operations."""
 
     @pytest.mark.asyncio
-    async def test_save_new_transaction(self, test_db_session: AsyncSession, sample_transaction: Transaction) -> None:
+    async def test_save_new_transactions(self, test_db_session: AsyncSession, sample_transaction: Transaction) -> None:
         """Test saving a new transaction."""
         repository = Repository(test_db_session)
 
-        await repository.save_transaction(sample_transaction)
+        await repository.save_transactions([sample_transaction])
 
         # Verify transaction was saved
         result = await test_db_session.execute(
@@ -82,24 +82,26 @@ class TestTransactionRepository:
         assert row[5] == 136  # to_team_id
 
     @pytest.mark.asyncio
-    async def test_save_update_existing_transaction(self, test_db_session: AsyncSession, sample_transaction: Transaction) -> None:
-        """Test updating an existing transaction."""
+    async def test_save_transactions_upserts_and_keeps_notified(self, test_db_session: AsyncSession, sample_transaction: Transaction) -> None:
+        """Test that the bulk upsert updates fields but not the notification flag."""
         repository = Repository(test_db_session)
 
-        # Save initial transaction
-        await repository.save_transaction(sample_transaction)
+        await repository.save_transactions([sample_transaction])
+        await repository.mark_transaction_notified(sample_transaction.transaction_id)
+        assert await repository.get_existing_transaction_ids([sample_transaction.transaction_id, 1]) == {
+            sample_transaction.transaction_id
+        }
 
-        # Update transaction description
-        sample_transaction.description = "Updated description"
-        await repository.save_transaction(sample_transaction)
+        updated = sample_transaction.model_copy(update={"description": "Updated description"})
+        await repository.save_transactions([updated])
 
-        # Verify update
         result = await test_db_session.execute(
-            text("SELECT description FROM transactions WHERE transaction_id = 123456")
+            text("SELECT description, notification_sent FROM transactions WHERE transaction_id = 123456")
         )
         row = result.fetchone()
         assert row is not None
         assert row[0] == "Updated description"
+        assert row[1] == 1
 
     @pytest.mark.asyncio
     async def test_get_new_transactions(self, test_db_session: AsyncSession, sample_transaction: Transaction) -> None:
@@ -107,7 +109,7 @@ class TestTransactionRepository:
         repository = Repository(test_db_session)
 
         # Save transaction
-        await repository.save_transaction(sample_transaction)
+        await repository.save_transactions([sample_transaction])
 
         # Get new transactions
         new_transactions = await repository.get_new_transactions()
@@ -122,7 +124,7 @@ class TestTransactionRepository:
         repository = Repository(test_db_session)
 
         # Save transaction
-        await repository.save_transaction(sample_transaction)
+        await repository.save_transactions([sample_transaction])
 
         # Mark as notified
         await repository.mark_transaction_notified(sample_transaction.transaction_id)
@@ -138,7 +140,7 @@ class TestTransactionRepository:
         repository = Repository(test_db_session)
 
         # Save transaction
-        await repository.save_transaction(sample_transaction)
+        await repository.save_transactions([sample_transaction])
 
         # Mark as notified
         await repository.mark_transaction_notified(sample_transaction.transaction_id)
@@ -165,10 +167,10 @@ class TestTransactionRepository:
         row = result.fetchone()
 
         assert row is not None
-        assert row[1] == 12345  # chat_id
-        assert row[2] == 1  # trades (SQLite returns 1 for True)
-        assert row[3] == 1  # signings (SQLite returns 1 for True)
-        assert row[6] == 0  # injuries (SQLite returns 0 for False)
+        assert row.chat_id == 12345
+        assert row.preferences_mask & TransactionPreferenceFlag.TRADES
+        assert row.preferences_mask & TransactionPreferenceFlag.SIGNINGS
+        assert not row.preferences_mask & TransactionPreferenceFlag.INJURIES
 
     @pytest.mark.asyncio
     async def test_save_user_transaction_preferences_update(self, test_db_session: AsyncSession, sample_preferences: UserTransactionPreferences) -> None:
@@ -185,12 +187,12 @@ class TestTransactionRepository:
 
         # Verify update
         result = await test_db_session.execute(
-            text("SELECT trades, injuries FROM user_transaction_preferences WHERE chat_id = 12345")
+            text("SELECT preferences_mask FROM user_transaction_preferences WHERE chat_id = 12345")
         )
         row = result.fetchone()
         assert row is not None
-        assert row[0] == 0  # trades (SQLite returns 0 for False)
-        assert row[1] == 1  # injuries (SQLite returns 1 for True)
+        assert not row[0] & TransactionPreferenceFlag.TRADES
+        assert row[0] & TransactionPreferenceFlag.INJURIES
 
     @pytest.mark.asyncio
     async def test_get_user_transaction_preferences_existing(self, test_db_session: AsyncSession, sample_preferences: UserTransactionPreferences) -> None:
@@ -223,7 +225,26 @@ class TestTransactionRepository:
         assert retrieved_prefs.major_league_only is True  # Default value
 
     @pytest.mark.asyncio
-    async def test_get_users_for_transaction_notification(self, test_db_session: AsyncSession) -> None:
+    async def test_toggle_user_transaction_preference(self, test_db_session: AsyncSession) -> None:
+        """Test that toggles flip the stored value, starting from the defaults."""
+        repository = Repository(test_db_session)
+
+        toggled = await repository.toggle_user_transaction_preference(99999, "trades")
+        assert toggled.trades is False
+        assert toggled.signings is True  # Untouched default
+
+        # A second toggle works from the stored value, not a stale copy
+        await repository.toggle_user_transaction_preference(99999, "releases")
+        toggled = await repository.toggle_user_transaction_preference(99999, "major_league_only")
+        assert toggled.trades is False
+        assert toggled.releases is True
+        assert toggled.major_league_only is False
+
+        stored = await repository.get_user_transaction_preferences(99999)
+        assert stored == toggled
+
+    @pytest.mark.asyncio
+    async def test_get_transaction_recipient_ids_matching_preferences(self, test_db_session: AsyncSession) -> None:
         """Test getting users who should be notified for a specific transaction."""
         repository = Repository(test_db_session)
 
@@ -262,15 +283,10 @@ class TestTransactionRepository:
         await test_db_session.commit()
 
         # Get users for notification
-        users_prefs = await repository.get_users_for_transaction_notification(trade_transaction)
-
-        assert len(users_prefs) == 1
-        user, preferences = users_prefs[0]
-        assert user.chat_id == 12345
-        assert preferences.trades is True
+        assert await repository.get_transaction_recipient_ids(trade_transaction) == [12345]
 
     @pytest.mark.asyncio
-    async def test_get_users_for_transaction_notification_filtered(self, test_db_session: AsyncSession) -> None:
+    async def test_get_transaction_recipient_ids_filtered(self, test_db_session: AsyncSession) -> None:
         """Test that users are filtered based on preferences."""
         repository = Repository(test_db_session)
 
@@ -304,11 +320,67 @@ class TestTransactionRepository:
 
         await test_db_session.commit()
 
-        # Get users for notification
-        users_prefs = await repository.get_users_for_transaction_notification(trade_transaction)
-
         # Should be empty since user disabled trade notifications
-        assert len(users_prefs) == 0
+        assert await repository.get_transaction_recipient_ids(trade_transaction) == []
+
+    @pytest.mark.asyncio
+    async def test_get_transaction_recipient_ids_default_preferences(self, test_db_session: AsyncSession) -> None:
+        """Test that users without saved preferences are matched against the defaults."""
+        repository = Repository(test_db_session)
+
+        from mariners_bot.database.models import UserRecord
+        test_db_session.add(UserRecord(chat_id=12345, username="testuser", subscribed=True))
+        await test_db_session.commit()
+
+        def make_transaction(type_code: str, type_description: str) -> Transaction:
+            return Transaction(
+                transaction_id=1,
+                person_id=1,
+                person_name="Some Player",
+                transaction_date=date.today(),
+                type_code=type_code,
+                type_description=type_description,
+                description="Seattle Mariners transaction.",
+            )
+
+        # Trades are on by default, releases are off
+        assert await repository.get_transaction_recipient_ids(make_transaction("TR", "Trade")) == [12345]
+        assert await repository.get_transaction_recipient_ids(make_transaction("REL", "Released")) == []
+
+    @pytest.mark.asyncio
+    async def test_get_transaction_recipient_ids(self, test_db_session: AsyncSession) -> None:
+        """Test that recipients are filtered by type and major-league preference in SQL."""
+        repository = Repository(test_db_session)
+
+        from mariners_bot.database.models import UserRecord
+        test_db_session.add_all([
+            UserRecord(chat_id=1, subscribed=True),   # Default preferences
+            UserRecord(chat_id=2, subscribed=True),   # All levels
+            UserRecord(chat_id=3, subscribed=False),  # Unsubscribed
+        ])
+        await test_db_session.commit()
+        await repository.save_user_transaction_preferences(
+            UserTransactionPreferences(chat_id=2, major_league_only=False)
+        )
+
+        def make_transaction(description: str) -> Transaction:
+            return Transaction(
+                transaction_id=1,
+                person_id=1,
+                person_name="Some Player",
+                transaction_date=date.today(),
+                type_code="TR",
+                type_description="Trade",
+                description=description,
+            )
+
+        major = await repository.get_transaction_recipient_ids(make_transaction("Seattle Mariners traded player."))
+        minor = await repository.get_transaction_recipient_ids(
+            make_transaction("Seattle Mariners traded minor league player.")
+        )
+
+        assert sorted(major) == [1, 2]
+        assert minor == [2]
 
     @pytest.mark.asyncio
     async def test_transaction_record_to_model_conversion(self, test_db_session: AsyncSession, sample_transaction: Transaction) -> None:
@@ -316,7 +388,7 @@ class TestTransactionRepository:
         repository = Repository(test_db_session)
 
         # Save transaction
-        await repository.save_transaction(sample_transaction)
+        await repository.save_transactions([sample_transaction])
 
         # Get new transactions (which uses the conversion)
         new_transactions = await repository.get_new_transactions()
@@ -326,6 +398,9 @@ class TestTransactionRepository:
         assert transaction.transaction_id == sample_transaction.transaction_id
         assert transaction.person_name == sample_transaction.person_name
         assert transaction.transaction_type == TransactionType.SIGNED_FREE_AGENT
+        # Rows are built without validation, so DateTime columns must be narrowed
+        assert type(transaction.transaction_date) is date
+        assert transaction.transaction_date == sample_transaction.transaction_date
 
     @pytest.mark.asyncio
     async def test_user_preferences_record_to_model_conversion(self, test_db_session: AsyncSession, sample_preferences: UserTransactionPreferences) -> None:
@@ -0,0 +1,43 @@
+"""Tests for per-chat ordered update processing."""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from telegram import Update
+
+from mariners_bot.bot.update_processor import PerChatUpdateProcessor
+
+
+def make_update(chat_id: int) -> Mock:
+    """Build a stand-in update from the given chat."""
+    update = Mock(spec=Update)
+    update.effective_chat = Mock(id=chat_id)
+    return update
+
+
+class TestPerChatUpdateProcessor:
+    """Test update ordering and concurrency."""
+
+    @pytest.mark.asyncio
+    async def test_same_chat_runs_in_order(self) -> None:
+        """Test that a slow update holds back later updates from its chat only."""
+        processor = PerChatUpdateProcessor(8)
+        events: list[str] = []
+
+        async def handle(name: str, delay: float) -> None:
+            events.append(f"{name} start")
+            await asyncio.sleep(delay)
+            events.append(f"{name} end")
+
+        await asyncio.gather(
+            processor.process_update(make_update(1), handle("a1", 0.05)),
+            processor.process_update(make_update(1), handle("a2", 0)),
+            processor.process_update(make_update(2), handle("b1", 0)),
+        )
+
+        # a2 waits for a1, while chat 2 doesn't wait for chat 1
+        assert events.index("a1 end") < events.index("a2 start")
+        assert events.index("b1 end") < events.index("a1 end")
+        assert processor._chat_locks == {}
+        assert processor._chat_pending == {}
@@ -0,0 +1,108 @@
+"""Tests for user database operations."""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from mariners_bot.database.models import Base, UserRecord
+from mariners_bot.database.repository import Repository
+
+
+@pytest.fixture
+async def test_db_session() -> AsyncIterator[AsyncSession]:
+    """Create a test database session."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+
+    # Create tables
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    # Create session
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with async_session() as session:
+        yield session
+
+    await engine.dispose()
+
+
+async def get_user_record(session: AsyncSession, chat_id: int) -> UserRecord | None:
+    """Load a user row fresh from the database, bypassing the identity map."""
+    return await session.get(UserRecord, chat_id, populate_existing=True)
+
+
+class TestUserRepository:
+    """Test user database operations."""
+
+    @pytest.mark.asyncio
+    async def test_upsert_user_profile_new(self, test_db_session: AsyncSession) -> None:
+        """Test that upserting an unknown user creates a subscribed record."""
+        repository = Repository(test_db_session)
+
+        await repository.upsert_user_profile(12345, "mariner", "Ken", "Griffey")
+
+        user = await get_user_record(test_db_session, 12345)
+        assert user is not None
+        assert user.username == "mariner"
+        assert (user.first_name, user.last_name) == ("Ken", "Griffey")
+        assert user.subscribed is True
+
+    @pytest.mark.asyncio
+    async def test_upsert_user_profile_keeps_subscription(self, test_db_session: AsyncSession) -> None:
+        """Test that a profile-only upsert leaves the subscription flag alone."""
+        repository = Repository(test_db_session)
+
+        await repository.upsert_user_profile(12345, "mariner", "Ken", None, subscribed=False)
+        await repository.upsert_user_profile(12345, None, "Ken", "Griffey")
+
+        user = await get_user_record(test_db_session, 12345)
+        assert user is not None
+        assert user.subscribed is False
+        assert user.username == "mariner"  # Kept when no new value is sent
+        assert user.last_name == "Griffey"
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_last_seen(self, test_db_session: AsyncSession) -> None:
+        """Test updating last_seen for several users at once."""
+        repository = Repository(test_db_session)
+
+        await repository.upsert_user_profile(1, "one", "One", None)
+        await repository.upsert_user_profile(2, "two", "Two", None)
+
+        first = datetime(2025, 4, 1, 12, 0, tzinfo=UTC)
+        second = datetime(2025, 4, 1, 12, 5, tzinfo=UTC)
+        await repository.bulk_update_last_seen({1: first, 2: second, 3: second})
+
+        user_one = await get_user_record(test_db_session, 1)
+        user_two = await get_user_record(test_db_session, 2)
+        assert user_one is not None and user_one.last_seen is not None
+        assert user_two is not None and user_two.last_seen is not None
+        assert user_one.last_seen.replace(tzinfo=UTC) == first
+        assert user_two.last_seen.replace(tzinfo=UTC) == second
+        assert await get_user_record(test_db_session, 3) is None
+
+    @pytest.mark.asyncio
+    async def test_get_subscription_status(self, test_db_session: AsyncSession) -> None:
+        """Test the three-way subscription lookup used by /status."""
+        repository = Repository(test_db_session)
+
+        await repository.upsert_user_profile(1, "one", "One", None, subscribed=True)
+        await repository.upsert_user_profile(2, "two", "Two", None, subscribed=False)
+
+        assert await repository.get_subscription_status(1) is True
+        assert await repository.get_subscription_status(2) is False
+        assert await repository.get_subscription_status(3) is None
+
+    @pytest.mark.asyncio
+    async def test_iter_subscribed_chat_ids(self, test_db_session: AsyncSession) -> None:
+        """Test streaming only subscribed chat IDs across several batches."""
+        repository = Repository(test_db_session)
+
+        for chat_id in range(1, 6):
+            await repository.upsert_user_profile(chat_id, None, None, None, subscribed=chat_id != 3)
+
+        chat_ids = [chat_id async for chat_id in repository.iter_subscribed_chat_ids(batch_size=2)]
+
+        assert sorted(chat_ids) == [1, 2, 4, 5]